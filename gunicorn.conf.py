@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the labctl backend
+
+Used when running `gunicorn src.backend.wsgi:app` from the project root
+(gunicorn picks this file up automatically). Mirrors the systemd unit in
+config/systemd/labctl-backend.service.
+
+gthread workers are used rather than gevent: the long-poll and SSE task
+endpoints park a thread per waiting client, and plain threads avoid
+pulling in a monkey-patching dependency for a handful of concurrent
+connections.
+"""
+bind = "0.0.0.0:5001"
+worker_class = "gthread"
+workers = 2
+threads = 8
+# SSE streams and ?wait= long-polls hold connections open; keep the
+# graceful timeout above the 55s long-poll ceiling
+graceful_timeout = 90
+timeout = 120
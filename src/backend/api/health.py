@@ -14,12 +14,8 @@ def health():
 
 @health_bp.route('/api/config', methods=['GET'])
 def get_config():
-    """Get current configuration"""
-    # Remove sensitive data
-    config = current_app.lab_manager.config.copy()
-    if 'netbox' in config and 'token' in config['netbox']:
-        config['netbox']['token'] = "***"
-    return jsonify(config)
+    """Get current configuration (sensitive values pre-redacted)"""
+    return jsonify(current_app.lab_manager.redacted_config)
 
 
 @health_bp.route('/api/netbox/validate', methods=['GET'])
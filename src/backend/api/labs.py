@@ -1,13 +1,16 @@
 """
 Lab deployment and management API endpoints
 """
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, jsonify, request, current_app, send_file
 from pathlib import Path
+import os
+
+from ..utils.helpers import json_response
 
 labs_bp = Blueprint('labs', __name__)
 
 
-@labs_bp.route('/api/labs/<lab_id>/deploy', methods=['POST'])
+@labs_bp.route('/api/labs/<id:lab_id>/deploy', methods=['POST'])
 def deploy_lab(lab_id):
     """Deploy a lab (async)"""
     data = request.json or {}
@@ -22,7 +25,7 @@ def deploy_lab(lab_id):
     }), 202
 
 
-@labs_bp.route('/api/labs/<lab_id>/destroy', methods=['POST'])
+@labs_bp.route('/api/labs/<id:lab_id>/destroy', methods=['POST'])
 def destroy_lab(lab_id):
     """Destroy a deployed lab"""
     result = current_app.lab_manager.destroy_lab(lab_id)
@@ -35,17 +38,17 @@ def destroy_lab(lab_id):
 @labs_bp.route('/api/deployments', methods=['GET'])
 def get_deployments():
     """Get all active deployments"""
-    return jsonify(current_app.lab_manager.get_status())
+    return json_response(current_app.lab_manager.get_status())
 
 
-@labs_bp.route('/api/labs/<lab_id>/scenarios', methods=['GET'])
+@labs_bp.route('/api/labs/<id:lab_id>/scenarios', methods=['GET'])
 def list_scenarios(lab_id):
     """List configuration scenarios for a lab"""
     scenarios = current_app.lab_manager.list_config_scenarios(lab_id)
     return jsonify({"lab_id": lab_id, "scenarios": scenarios})
 
 
-@labs_bp.route('/api/labs/<lab_id>/scenarios/<scenario>', methods=['POST'])
+@labs_bp.route('/api/labs/<id:lab_id>/scenarios/<scenario>', methods=['POST'])
 def apply_scenario(lab_id, scenario):
     """Apply a configuration scenario"""
     result = current_app.lab_manager.apply_config_scenario(lab_id, scenario)
@@ -55,18 +58,55 @@ def apply_scenario(lab_id, scenario):
         return jsonify(result), 400
 
 
-@labs_bp.route('/api/logs/<lab_id>', methods=['GET'])
-def get_logs(lab_id):
-    """Get deployment logs for a lab"""
-    # Find the most recent deployment log
-    for dep_id, dep_info in sorted(current_app.lab_manager.state["deployments"].items(), reverse=True):
+def _latest_deployment(state, lab_id):
+    """Find the newest deployment id for a lab
+
+    Deploys maintain a latest_deployment index for an O(1) lookup; states
+    written before the index existed fall back to the sorted scan.
+    """
+    dep_id = state.get("latest_deployment", {}).get(lab_id)
+    if dep_id and dep_id in state["deployments"]:
+        return dep_id
+
+    for dep_id, dep_info in sorted(state["deployments"].items(), reverse=True):
         if dep_info["lab_id"] == lab_id:
-            log_file = Path(dep_info.get("log_file", ""))
-            if log_file.exists():
-                with open(log_file) as f:
-                    return jsonify({
-                        "deployment_id": dep_id,
-                        "log": f.read()
-                    })
-    
+            return dep_id
+    return None
+
+
+def _tail_file(path, lines):
+    """Read roughly the last N lines without touching the whole file"""
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        # 64 bytes/line is a heuristic; splitting trims any extra
+        f.seek(max(0, size - 64 * lines))
+        tail = f.read().splitlines()[-lines:]
+    return b'\n'.join(tail) + b'\n'
+
+
+@labs_bp.route('/api/logs/<id:lab_id>', methods=['GET'])
+def get_logs(lab_id):
+    """Stream deployment logs for a lab, optionally only the last N lines"""
+    state = current_app.lab_manager.state
+    tail = request.args.get('tail', type=int)
+    dep_id = _latest_deployment(state, lab_id)
+    if dep_id:
+        log_file = Path(state["deployments"][dep_id].get("log_file", ""))
+        if log_file.exists():
+            if tail and tail > 0:
+                response = Response(_tail_file(log_file, tail), mimetype='text/plain')
+                response.headers['X-Deployment-Id'] = dep_id
+                return response
+            # send_file uses the WSGI file wrapper (sendfile where the
+            # server supports it, or X-Sendfile behind a reverse proxy)
+            # and conditional=True answers If-Modified-Since with a 304
+            # max_age=0 opts logs out of the long SEND_FILE_MAX_AGE_DEFAULT
+            # meant for hashed static assets; the ETag still enables 304s
+            response = send_file(
+                str(log_file), mimetype='text/plain', conditional=True,
+                etag=True, max_age=0
+            )
+            response.headers['X-Deployment-Id'] = dep_id
+            return response
+
     return jsonify({"error": "No logs found"}), 404
\ No newline at end of file
@@ -1,16 +1,29 @@
 """
 Repository management API endpoints
 """
-from flask import Blueprint, jsonify, request, current_app
+import hashlib
+import orjson
+from flask import Blueprint, Response, jsonify, request, current_app
 
 repos_bp = Blueprint('repos', __name__)
 
 
 @repos_bp.route('/api/repos', methods=['GET'])
 def list_repos():
-    """List all lab repositories"""
-    repos = current_app.lab_manager.list_repos()
-    return jsonify(repos)
+    """List all lab repositories
+
+    The listing itself is memoized in LabManager against the repo
+    version counter; here an ETag over the serialized body lets polling
+    clients get a bodyless 304 when nothing changed.
+    """
+    body = orjson.dumps(current_app.lab_manager.list_repos())
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304)
+
+    response = Response(body, mimetype='application/json')
+    response.headers['ETag'] = etag
+    return response
 
 
 @repos_bp.route('/api/repos', methods=['POST'])
@@ -27,7 +40,17 @@ def add_repo():
         return jsonify(result), 400
 
 
-@repos_bp.route('/api/repos/<lab_id>', methods=['PUT'])
+@repos_bp.route('/api/repos/refresh', methods=['POST'])
+def refresh_repos():
+    """Update all lab repositories in parallel"""
+    result = current_app.lab_manager.update_all_repos()
+    if result['success']:
+        return jsonify(result)
+    else:
+        return jsonify(result), 400
+
+
+@repos_bp.route('/api/repos/<id:lab_id>', methods=['PUT'])
 def update_repo(lab_id):
     """Update a lab repository"""
     result = current_app.lab_manager.update_repo(lab_id)
@@ -37,7 +60,7 @@ def update_repo(lab_id):
         return jsonify(result), 400
 
 
-@repos_bp.route('/api/repos/<lab_id>', methods=['DELETE'])
+@repos_bp.route('/api/repos/<id:lab_id>', methods=['DELETE'])
 def remove_repo(lab_id):
     """Remove a lab repository"""
     result = current_app.lab_manager.remove_repo(lab_id)
@@ -1,48 +1,78 @@
 """
 Settings API endpoints
 """
+import copy
+from datetime import datetime, timezone
 from flask import Blueprint, request, jsonify
-from ..core.config import load_config, update_config
+from ..core.config import load_config, update_config, active_config_file
 import logging
 
 logger = logging.getLogger(__name__)
 
 settings_bp = Blueprint('settings', __name__)
 
+# Masked settings keyed on the config file's mtime; a POST rewrites the
+# file and so invalidates this naturally
+_settings_cache = {'mtime_ns': None, 'masked': None}
+
+
+# Every secret-bearing key path in the config; one generic walker masks
+# them all instead of hand-written copy+mutate blocks per field
+MASK_PATHS = (
+    ('clab_tools_password',),
+    ('remote_credentials', 'ssh_password'),
+    ('remote_credentials', 'sudo_password'),
+    ('netbox', 'token'),
+)
+
 
 def _mask_passwords(config):
     """Return config with passwords masked for API responses"""
-    masked_config = config.copy()
-    
-    # Mask individual password fields
-    if 'clab_tools_password' in masked_config and masked_config['clab_tools_password']:
-        masked_config['clab_tools_password'] = '****'
-    
-    # Mask remote credentials
-    if 'remote_credentials' in masked_config:
-        creds = masked_config['remote_credentials'].copy()
-        if creds.get('ssh_password'):
-            creds['ssh_password'] = '****'
-        if creds.get('sudo_password'):
-            creds['sudo_password'] = '****'
-        masked_config['remote_credentials'] = creds
-    
-    # Mask NetBox token
-    if 'netbox' in masked_config and masked_config['netbox'].get('token'):
-        netbox = masked_config['netbox'].copy()
-        netbox['token'] = '****'
-        masked_config['netbox'] = netbox
-    
+    masked_config = copy.deepcopy(config)
+
+    for path in MASK_PATHS:
+        node = masked_config
+        for key in path[:-1]:
+            node = node.get(key)
+            if not isinstance(node, dict):
+                break
+        else:
+            if node.get(path[-1]):
+                node[path[-1]] = '****'
+
     return masked_config
 
 
 @settings_bp.route('/api/config/settings', methods=['GET'])
 def get_settings():
-    """Get current configuration settings (with passwords masked)"""
+    """Get current configuration settings (with passwords masked)
+
+    The masked view is cached against the config file's mtime and the
+    response carries Last-Modified, so polling clients get a 304 and a
+    cache hit skips the read+mask path entirely.
+    """
     try:
-        config = load_config()
-        masked_config = _mask_passwords(config)
-        return jsonify(masked_config)
+        config_file = active_config_file()
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            stat = None
+
+        if stat and _settings_cache['mtime_ns'] == stat.st_mtime_ns:
+            masked_config = _settings_cache['masked']
+        else:
+            masked_config = _mask_passwords(load_config())
+            if stat:
+                _settings_cache['mtime_ns'] = stat.st_mtime_ns
+                _settings_cache['masked'] = masked_config
+
+        response = jsonify(masked_config)
+        if stat:
+            response.last_modified = datetime.fromtimestamp(
+                stat.st_mtime, timezone.utc
+            )
+            response.make_conditional(request)
+        return response
     except Exception as e:
         logger.error(f"Error loading settings: {e}")
         return jsonify({"error": "Failed to load settings"}), 500
@@ -66,7 +96,16 @@ def update_settings():
         
         if not filtered_data:
             return jsonify({"error": "No valid settings provided"}), 400
-        
+
+        # update_config writes config.yaml; if config.toml is active the
+        # write would be a silent no-op, so refuse rather than pretend
+        config_file = active_config_file()
+        if config_file.suffix == '.toml':
+            return jsonify({
+                "error": f"{config_file.name} is active and read-only; "
+                         "edit it directly or remove it to manage settings here"
+            }), 400
+
         # Update configuration
         updated_config = update_config(filtered_data)
         
@@ -1,15 +1,86 @@
 """
 Async task management API endpoints
 """
-from flask import Blueprint, jsonify, current_app
+import orjson
+# futures raise their own TimeoutError; it only aliases the builtin on
+# Python 3.11+, so catching the builtin misses the timeout on 3.9/3.10
+from concurrent.futures import TimeoutError as FutureTimeout
+from flask import Blueprint, Response, current_app, request, stream_with_context
+
+from ..utils.helpers import json_response
 
 tasks_bp = Blueprint('tasks', __name__)
 
+# Upper bound on how long an SSE consumer can hang on one task
+EVENT_STREAM_TIMEOUT = 3600
+# Comment frames at this interval keep proxies from dropping idle streams
+EVENT_STREAM_HEARTBEAT = 15
+# Ceiling for ?wait= long polls; keeps a worker thread blocked at most this long
+LONG_POLL_MAX_WAIT = 55
+
+
+def _sse_event(status):
+    return b'data: ' + orjson.dumps(status) + b'\n\n'
+
 
-@tasks_bp.route('/api/tasks/<task_id>', methods=['GET'])
+@tasks_bp.route('/api/tasks/<id:task_id>', methods=['GET'])
 def get_task_status(task_id):
-    """Get status of an async task"""
-    status = current_app.lab_manager.get_task_status(task_id)
+    """Get status of an async task
+
+    Pass ?wait=<seconds> to long-poll: the request hangs until the task
+    reaches a terminal state or the wait elapses (204), cutting request
+    volume for clients that can't consume the SSE stream.
+    """
+    lab_manager = current_app.lab_manager
+    status = lab_manager.get_task_status(task_id)
+    if 'error' in status:
+        return json_response(status, status=404)
+
+    wait = request.args.get('wait', type=int)
+    if wait and status.get('status') not in ('completed', 'failed'):
+        future = lab_manager.active_tasks.get(task_id, {}).get('future')
+        if future is not None:
+            try:
+                future.result(timeout=min(wait, LONG_POLL_MAX_WAIT))
+            except FutureTimeout:
+                return Response(status=204)
+            except Exception:
+                pass  # the refreshed status carries the failure
+        status = lab_manager.get_task_status(task_id)
+
+    return json_response(status)
+
+
+@tasks_bp.route('/api/tasks/<id:task_id>/events', methods=['GET'])
+def task_events(task_id):
+    """Push task-state transitions as server-sent events
+
+    Emits the current status immediately, then blocks on the task future
+    and emits the final status when it completes, so clients don't have
+    to poll on an interval.
+    """
+    lab_manager = current_app.lab_manager
+
+    status = lab_manager.get_task_status(task_id)
     if 'error' in status:
-        return jsonify(status), 404
-    return jsonify(status)
\ No newline at end of file
+        return json_response(status, status=404)
+
+    def stream():
+        yield _sse_event(status)
+
+        future = lab_manager.active_tasks.get(task_id, {}).get('future')
+        if future is not None and not future.done():
+            waited = 0
+            while waited < EVENT_STREAM_TIMEOUT:
+                try:
+                    future.result(timeout=EVENT_STREAM_HEARTBEAT)
+                    break
+                except FutureTimeout:
+                    waited += EVENT_STREAM_HEARTBEAT
+                    yield b': keep-alive\n\n'
+                except Exception:
+                    break  # final status below reports the failure
+
+        yield _sse_event(lab_manager.get_task_status(task_id))
+
+    return Response(stream_with_context(stream()), mimetype='text/event-stream')
\ No newline at end of file
@@ -1,10 +1,23 @@
 """
 Homelab Manager Flask Backend API
 """
+import functools
+import gzip
+import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from flask import Flask, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
+from werkzeug.routing import BaseConverter
+
+# Optional: serves /static/ from a WSGI middleware with precompressed
+# variants instead of Python-level file reads per request
+try:
+    from whitenoise import WhiteNoise
+except ImportError:
+    WhiteNoise = None
 
 # Import core modules
 from .core.config import load_config
@@ -15,18 +28,90 @@ from .core.clab_runner import ClabRunner
 # Import API blueprints
 from .api import repos_bp, labs_bp, tasks_bp, health_bp
 from .api.settings import settings_bp
+from .utils.helpers import OrjsonProvider
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# The runners carry no per-app state worth isolating (only internal
+# caches), so repeated create_app calls — common in test suites — reuse
+# them instead of re-running constructor disk work like logs_dir.mkdir
+@functools.lru_cache(maxsize=8)
+def _build_git_ops(git_cmd: str) -> GitOperations:
+    return GitOperations(git_cmd)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_clab_runner(clab_tools_cmd: str, logs_dir: str) -> ClabRunner:
+    return ClabRunner(clab_tools_cmd, Path(logs_dir))
+
+
+class IdConverter(BaseConverter):
+    """URL converter for lab/task identifiers
+
+    Rejecting malformed IDs in the router returns the 404 before any
+    handler or state lookup runs. Dots are allowed because add_repo
+    derives lab ids from repo directory names, which may contain them.
+    """
+    regex = r'[a-zA-Z0-9._\-]{1,64}'
+
+
+def _asset_versions(static_folder: Path) -> dict:
+    """Hash each css/js asset once so HTML can carry cache-busting URLs"""
+    versions = {}
+    for sub in ('css', 'js'):
+        asset_dir = static_folder / sub
+        if asset_dir.is_dir():
+            for asset in asset_dir.iterdir():
+                if asset.is_file():
+                    digest = hashlib.blake2b(asset.read_bytes(), digest_size=8)
+                    versions[f'{sub}/{asset.name}'] = digest.hexdigest()
+    return versions
+
+
+def _compress_page(page: Path, asset_versions: dict) -> tuple:
+    """Read, version asset URLs, gzip, and ETag one HTML entry point"""
+    body = page.read_bytes()
+    # Rewriting css/js references to content-hashed URLs lets the assets
+    # be served with a year-long max_age and still update on deploy
+    for rel_path, digest in asset_versions.items():
+        body = body.replace(rel_path.encode(), f'{rel_path}?v={digest}'.encode())
+    etag = f'"{hashlib.sha256(body).hexdigest()}"'
+    return body, gzip.compress(body), etag, page.stat().st_mtime_ns
+
+
+def _precompress_pages(static_folder: Path) -> dict:
+    """Gzip the HTML entry points once at startup and compute their ETags"""
+    asset_versions = _asset_versions(static_folder)
+    pages = {}
+    for name in ('index.html', 'settings.html'):
+        page = static_folder / name
+        if page.exists():
+            pages[name] = _compress_page(page, asset_versions)
+    return pages
+
+
 def create_app(test_config=None):
     """Application factory pattern"""
+    # Logging is configured here rather than at import so merely
+    # importing the module stays side-effect-free (basicConfig is a
+    # no-op if the host process already configured handlers)
+    logging.basicConfig(level=logging.INFO)
+
     # Initialize Flask app with static folder configuration
     static_folder = Path(__file__).parent.parent / 'web' / 'static'
     app = Flask(__name__, static_url_path='/static', static_folder=str(static_folder))
+    app.json = OrjsonProvider(app)  # jsonify() everywhere serializes via orjson
     CORS(app)  # Enable CORS for all routes
+
+    # Behind nginx/Apache, set USE_X_SENDFILE=1 so send_file responses
+    # (e.g. deployment logs) are handed off to the reverse proxy and the
+    # kernel does the byte copying; requires a matching internal alias
+    app.config['USE_X_SENDFILE'] = bool(os.environ.get('USE_X_SENDFILE'))
+
+    # Static assets are immutable once their URL carries a content hash
+    # (see _asset_versions), so browsers may cache them for a year
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
     
     # Load configuration
     if test_config:
@@ -34,11 +119,11 @@ def create_app(test_config=None):
     else:
         config = load_config()
     
-    # Initialize core components
-    git_ops = GitOperations(config.get("git_cmd", "git"))
-    clab_runner = ClabRunner(
+    # Initialize core components (memoized across create_app calls)
+    git_ops = _build_git_ops(config.get("git_cmd", "git"))
+    clab_runner = _build_clab_runner(
         config.get("clab_tools_cmd", "clab-tools"),
-        Path(config.get("logs_dir", "/var/lib/labctl/logs"))
+        config.get("logs_dir", "/var/lib/labctl/logs")
     )
     
     # Initialize lab manager with injected dependencies
@@ -47,39 +132,104 @@ def create_app(test_config=None):
     # Store lab_manager on app for blueprint access
     app.lab_manager = lab_manager
     
-    # Register blueprints
+    # Register blueprints (the id converter must exist before their
+    # routes are parsed)
+    app.url_map.converters['id'] = IdConverter
     for blueprint in [repos_bp, labs_bp, tasks_bp, health_bp, settings_bp]:
         app.register_blueprint(blueprint)
     
+    # Batch aggregator: lets clients fold several API GETs into one
+    # round trip instead of issuing them as separate requests
+    @app.route('/api/batch', methods=['POST'])
+    def batch():
+        """Dispatch a list of GET paths in-process and return their bodies"""
+        paths = request.json
+        if not isinstance(paths, list):
+            return jsonify({"error": "Expected a JSON list of API paths"}), 400
+
+        def fetch(path):
+            if not isinstance(path, str) or not path.startswith('/api/'):
+                return path, {"error": "Only /api/ GET paths are allowed"}
+            with app.test_client() as client:
+                return path, client.get(path).get_json()
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for path, body in executor.map(fetch, paths):
+                results[path] = body
+
+        return jsonify(results)
+
     # Debug route to check paths
     @app.route('/debug/paths')
     def debug_paths():
-        web_dir = Path(__file__).parent.parent / 'web' / 'static'
         return {
-            'web_dir': str(web_dir),
-            'web_dir_resolved': str(web_dir.resolve()),
-            'web_dir_exists': web_dir.exists(),
+            'web_dir': str(static_folder),
+            'web_dir_resolved': str(static_folder.resolve()),
+            'web_dir_exists': static_folder.exists(),
             'cwd': str(Path.cwd()),
             'file': __file__
         }
     
+    # HTML entry points are precompressed at startup; conditional GETs
+    # answer with a bodyless 304 and gzip-capable clients get the
+    # precomputed compressed bytes
+    page_cache = _precompress_pages(static_folder)
+
+    def serve_page(name):
+        cached = page_cache.get(name)
+        if cached is None:
+            return send_from_directory(app.static_folder, name)
+
+        # One stat per request keeps local development edits live while
+        # production keeps serving the startup-compressed bytes
+        page = static_folder / name
+        try:
+            if page.stat().st_mtime_ns != cached[3]:
+                cached = page_cache[name] = _compress_page(
+                    page, _asset_versions(static_folder)
+                )
+        except OSError:
+            pass
+
+        body, gz_body, etag, _ = cached
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=304)
+
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = Response(gz_body, mimetype='text/html', direct_passthrough=True)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(body, mimetype='text/html', direct_passthrough=True)
+        response.headers['ETag'] = etag
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
     # Static file serving for web UI
     @app.route('/')
     def index():
         """Serve the web UI"""
-        return send_from_directory(app.static_folder, 'index.html')
-    
+        return serve_page('index.html')
+
     @app.route('/settings.html')
     def settings():
         """Serve the settings page"""
-        return send_from_directory(app.static_folder, 'settings.html')
-    
+        return serve_page('settings.html')
+
+    if WhiteNoise is not None:
+        # WhiteNoise takes over /static/ at the WSGI layer: files are
+        # indexed once, served with gzip variants and the same year-long
+        # max_age the hashed asset URLs rely on
+        app.wsgi_app = WhiteNoise(
+            app.wsgi_app, root=str(static_folder), prefix='/static/',
+            max_age=31536000
+        )
+
     return app
 
 
 if __name__ == '__main__':
     # Development server
-    import os
     app = create_app()
     port = int(os.environ.get('PORT', 5001))
     app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
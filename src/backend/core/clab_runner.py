@@ -2,9 +2,14 @@
 Containerlab tools runner module
 Handles all interactions with clab-tools for lab deployment and management
 """
+import csv
+import itertools
 import os
 import logging
+import shlex
+import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -12,21 +17,84 @@ from .config import load_config
 
 logger = logging.getLogger(__name__)
 
+# Process-wide sequence; combined with the timestamp it keeps ids unique
+# across deploys that land in the same second
+_deployment_seq = itertools.count()
+
+
+def new_deployment_id(lab_id: str) -> str:
+    """Build a unique, sortable deployment id
+
+    time.gmtime skips the timezone lookup datetime.now pays per call,
+    and the counter suffix disambiguates concurrent deploys of the same
+    lab — the second-resolution timestamp alone is not unique. The
+    timestamp prefix keeps string sort order equal to creation order,
+    which the latest-deployment fallback scan relies on.
+    """
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    return f"{lab_id}_{timestamp}_{next(_deployment_seq):04d}"
+
 
 class ClabRunner:
     """Executes clab-tools commands for lab management"""
-    
+
+    # Log directories already created this process; skips the mkdirat
+    # syscall for every construction after the first per directory
+    _ensured_dirs = set()
+
     def __init__(self, clab_tools_cmd: str = "clab-tools", logs_dir: Path = None):
         self.clab_tools_cmd = clab_tools_cmd
+        # Resolve once so every execve gets an absolute path and skips
+        # the kernel-side PATH walk; falls back to the bare name if the
+        # tool is not installed yet
+        self._resolved_cmd = shutil.which(clab_tools_cmd) or clab_tools_cmd
+        self._build_cmd_prefixes()
         self.logs_dir = logs_dir or Path("/var/lib/labctl/logs")
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-    
+        if self.logs_dir not in ClabRunner._ensured_dirs:
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            ClabRunner._ensured_dirs.add(self.logs_dir)
+        self._node_cache = {}  # nodes.csv path -> (mtime_ns, node list)
+        self._validate_cache = {}  # repo path -> (dir mtimes, validation result)
+        # Snapshot the environment once; per-deploy envs are built from
+        # this instead of re-copying os.environ on every bootstrap
+        self._base_env = dict(os.environ)
+
+    def _build_cmd_prefixes(self):
+        """Freeze the static argv prefixes for the bootstrap steps
+
+        Mirrors GitOperations' command templates: each call site only
+        appends the per-deploy argument instead of rebuilding the whole
+        list. Rebuilt whenever the resolved command path changes.
+        """
+        self._create_prefix = (self._resolved_cmd, "--quiet", "lab", "create")
+        self._switch_prefix = (self._resolved_cmd, "--quiet", "lab", "switch")
+        self._bootstrap_prefix = (
+            self._resolved_cmd,
+            "--quiet",
+            "--config", "clab_tools_files/config.yaml",
+            "lab", "bootstrap",
+            "--nodes", "clab_tools_files/nodes.csv",
+            "--connections", "clab_tools_files/connections.csv",
+            "--output",
+        )
+
     def _run_command(self, cmd: List[str], cwd: Optional[Path] = None,
                      capture_output: bool = True, log_file: Optional[Path] = None) -> subprocess.CompletedProcess:
-        """Run a command with optional logging"""
-        logger.debug(f"Running command: {' '.join(cmd)}")
-        if cwd:
-            logger.debug(f"Working directory: {cwd}")
+        """Run a command with optional logging
+
+        Keep these invocations free of preexec_fn, pass_fds and
+        shell=True: that lets CPython launch via posix_spawn (vfork)
+        instead of fork+exec where it can, which matters once the
+        backend process is large. Passing cwd still forces the fork
+        path on interpreters without spawn-time chdir support, so only
+        add a cwd when the command actually needs one.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            # shlex.join quotes arguments with spaces, and only runs
+            # when DEBUG is actually enabled
+            logger.debug("Running command: %s", shlex.join(cmd))
+            if cwd:
+                logger.debug("Working directory: %s", cwd)
         
         if log_file:
             with open(log_file, 'w') as log:
@@ -46,33 +114,45 @@ class ClabRunner:
             )
         
         if result.returncode != 0:
-            logger.error(f"Command failed: {' '.join(cmd)}")
+            logger.error("Command failed: %s", shlex.join(cmd))
             if capture_output and not log_file:
                 logger.error(f"Error output: {result.stderr}")
         
         return result
-    
-    def bootstrap_lab(self, lab_id: str, repo_path: Path, 
+
+    @staticmethod
+    def _log_tail(log_file: Path, lines: int = 200) -> str:
+        """Last N lines of a log file, for the failure payload"""
+        with open(log_file, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            # 64 bytes/line is a heuristic; splitting trims any extra
+            f.seek(max(0, size - 64 * lines))
+            tail = f.read().splitlines()[-lines:]
+        return b'\n'.join(tail).decode(errors='replace')
+
+    def bootstrap_lab(self, lab_id: str, repo_path: Path,
                      deployment_id: Optional[str] = None) -> Tuple[bool, Dict]:
         """Bootstrap a lab using clab-tools directly"""
         clab_tools_dir = repo_path / "clab_tools_files"
-        config_file = clab_tools_dir / "config.yaml"
-        nodes_file = clab_tools_dir / "nodes.csv"
-        connections_file = clab_tools_dir / "connections.csv"
-        
-        # Validate required files exist
-        missing_files = []
-        for file_path, name in [(config_file, "config.yaml"), (nodes_file, "nodes.csv"), (connections_file, "connections.csv")]:
-            if not file_path.exists():
-                missing_files.append(name)
-        
+
+        # Validate required files exist: one directory listing answers
+        # all three membership checks instead of a stat per file
+        try:
+            with os.scandir(clab_tools_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        missing_files = [
+            name for name in ("config.yaml", "nodes.csv", "connections.csv")
+            if name not in present
+        ]
+
         if missing_files:
             return False, {"error": f"Missing required files: {', '.join(missing_files)}"}
         
         # Create deployment ID if not provided
         if not deployment_id:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            deployment_id = f"{lab_id}_{timestamp}"
+            deployment_id = new_deployment_id(lab_id)
         
         # Create log file
         log_file = self.logs_dir / f"{deployment_id}.log"
@@ -93,7 +173,7 @@ class ClabRunner:
             
             try:
                 # Set environment variables for clab-tools
-                env = os.environ.copy()
+                env = dict(self._base_env)
                 config = load_config()
                 
                 # Set password for remote operations
@@ -129,51 +209,43 @@ class ClabRunner:
                 
                 # Step 1: Create lab
                 log.write("Step 1: Creating lab\n")
-                create_cmd = [self.clab_tools_cmd, "--quiet", "lab", "create", lab_id]
-                log.write(f"Command: {' '.join(create_cmd)}\n")
+                create_cmd = [*self._create_prefix, lab_id]
+                log.write(f"Command: {' '.join(create_cmd)}\nOutput:\n")
                 log.flush()
-                
+
+                # The child writes straight to the log fd, so nothing is
+                # buffered in memory and the output is tailable live
                 result = subprocess.run(
                     create_cmd,
                     cwd=str(repo_path),  # Run from repo directory to use correct config
-                    stdout=subprocess.PIPE,
+                    stdout=log,
                     stderr=subprocess.STDOUT,
                     text=True,
                     env=env
                 )
+                # Flushing only right before the next child inherits the
+                # fd keeps ordering correct with fewer write syscalls
                 log.write(f"Exit Code: {result.returncode}\n")
-                log.write(f"Output:\n{result.stdout}\n")
-                log.flush()
-                
+
                 # Step 2: Switch to lab
                 log.write("Step 2: Switching to lab\n")
-                switch_cmd = [self.clab_tools_cmd, "--quiet", "lab", "switch", lab_id]
-                log.write(f"Command: {' '.join(switch_cmd)}\n")
+                switch_cmd = [*self._switch_prefix, lab_id]
+                log.write(f"Command: {' '.join(switch_cmd)}\nOutput:\n")
                 log.flush()
-                
+
                 result = subprocess.run(
                     switch_cmd,
                     cwd=str(repo_path),  # Run from repo directory to use correct config
-                    stdout=subprocess.PIPE,
+                    stdout=log,
                     stderr=subprocess.STDOUT,
                     text=True,
                     env=env
                 )
                 log.write(f"Exit Code: {result.returncode}\n")
-                log.write(f"Output:\n{result.stdout}\n")
-                log.flush()
-                
+
                 # Step 3: Use clab-tools lab bootstrap command (unified command)
                 log.write("Step 3: Running clab-tools lab bootstrap\n")
-                cmd = [
-                    self.clab_tools_cmd,
-                    "--quiet",
-                    "--config", "clab_tools_files/config.yaml",
-                    "lab", "bootstrap",
-                    "--nodes", "clab_tools_files/nodes.csv",
-                    "--connections", "clab_tools_files/connections.csv", 
-                    "--output", output_file,
-                ]
+                cmd = [*self._bootstrap_prefix, output_file]
                 log.write(f"Command: {' '.join(cmd)}\n")
                 log.write(f"Working Directory: {repo_path}\n")
                 log.write(f"Environment Variables:\n")
@@ -182,47 +254,33 @@ class ClabRunner:
                     masked_value = '****' if value != 'NOT SET' else 'NOT SET'
                     log.write(f"  {key}: {masked_value}\n")
                 log.write("Starting bootstrap command...\n")
-                log.flush()
-                
-                # Run clab-tools from the lab repo directory 
+
+                # Run clab-tools from the lab repo directory
                 # This ensures it uses the correct config.yaml with remote settings
                 try:
-                    # Use Popen for real-time output streaming
-                    process = subprocess.Popen(
+                    # The child writes straight to the log fd — the same
+                    # kernel fast path steps 1 and 2 use — so no bytes
+                    # round-trip through Python, and the log stays
+                    # tailable live
+                    log.write("Command output (real-time):\n")
+                    log.flush()
+                    result = subprocess.run(
                         cmd,
                         cwd=str(repo_path),
-                        stdout=subprocess.PIPE,
+                        stdout=log,
                         stderr=subprocess.STDOUT,
                         stdin=subprocess.DEVNULL,  # Prevent hanging on prompts
                         text=True,
                         env=env,
-                        bufsize=1,  # Line buffered
-                        universal_newlines=True
+                        timeout=90
                     )
-                    
-                    # Stream output in real-time
-                    log.write("Command output (real-time):\n")
-                    output_lines = []
-                    for line in process.stdout:
-                        log.write(f"OUT: {line}")
-                        log.flush()
-                        output_lines.append(line)
-                    
-                    # Wait for completion with timeout
-                    try:
-                        process.wait(timeout=90)
-                    except subprocess.TimeoutExpired:
-                        log.write("Command timed out, killing process...\n")
-                        process.kill()
-                        process.wait()
-                        raise
-                    
-                    result_stdout = ''.join(output_lines)
-                    log.write(f"Exit Code: {process.returncode}\n")
+                    returncode = result.returncode
+
+                    log.write(f"Exit Code: {returncode}\n")
                     log.write(f"Command completed.\n")
                     log.flush()  # Ensure everything is written to disk
-                    
-                    if process.returncode == 0:
+
+                    if returncode == 0:
                         log.write("✓ Lab bootstrap completed successfully\n")
                         return True, {
                             "deployment_id": deployment_id,
@@ -231,11 +289,12 @@ class ClabRunner:
                         }
                     else:
                         log.write("✗ Lab bootstrap failed\n")
+                        log.flush()
                         return False, {
                             "error": "Bootstrap failed",
                             "log_file": str(log_file),
-                            "exit_code": process.returncode,
-                            "output": result_stdout
+                            "exit_code": returncode,
+                            "output": self._log_tail(log_file)
                         }
                 
                 except subprocess.TimeoutExpired:
@@ -265,7 +324,7 @@ class ClabRunner:
         
         # Use clab-tools lab teardown command
         cmd = [
-            self.clab_tools_cmd,
+            self._resolved_cmd,
             "--config", "config.yaml",
             "lab", "teardown"
         ]
@@ -312,7 +371,7 @@ class ClabRunner:
         # Construct clab-tools command
         # Example: clab-tools node config --name router1 --config router1.conf
         cmd = [
-            self.clab_tools_cmd,
+            self._resolved_cmd,
             "node", "config",
             "--name", node_name,
             "--config", str(config_file)
@@ -331,48 +390,94 @@ class ClabRunner:
             }
     
     def get_node_list(self, lab_id: str, repo_path: Path) -> List[str]:
-        """Get list of nodes in a deployed lab"""
+        """Get list of nodes in a deployed lab
+
+        Topologies change rarely, so the parsed list is cached and a
+        single stat call decides whether the CSV needs a re-read.
+        """
         nodes_file = repo_path / "clab_tools_files" / "nodes.csv"
-        
-        if not nodes_file.exists():
+
+        try:
+            stat = nodes_file.stat()
+        except FileNotFoundError:
             return []
-        
-        nodes = []
-        with open(nodes_file) as f:
-            # Skip header line
-            next(f, None)
-            for line in f:
-                if line.strip():
-                    # First column is the node name
-                    node_name = line.split(',')[0].strip()
-                    if node_name:
-                        nodes.append(node_name)
-        
+
+        key = str(nodes_file)
+        cached = self._node_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns:
+            return cached[1]
+
+        # csv.reader parses in C and handles quoted fields, unlike the
+        # old per-line split(',')
+        with open(nodes_file, newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header line
+            nodes = [
+                row[0].strip() for row in reader
+                if row and row[0].strip()
+            ]
+
+        self._node_cache[key] = (stat.st_mtime_ns, nodes)
         return nodes
     
     def validate_lab_files(self, repo_path: Path) -> Tuple[bool, List[str]]:
-        """Validate that all required lab files exist"""
-        required_files = [
-            "lab-metadata.yaml",
-            "clab_tools_files/config.yaml",
-            "clab_tools_files/nodes.csv",
-            "clab_tools_files/connections.csv"
-        ]
-        
+        """Validate that all required lab files exist
+
+        One directory listing per level answers every membership check,
+        instead of a stat syscall per required file, and the verdict is
+        cached against both directory mtimes — files appearing or
+        disappearing bump the parent directory's mtime, so an unchanged
+        pair means the cached answer still holds.
+        """
+        dir_mtimes = []
+        for dir_path in (repo_path, repo_path / "clab_tools_files"):
+            try:
+                dir_mtimes.append(os.stat(dir_path).st_mtime_ns)
+            except FileNotFoundError:
+                dir_mtimes.append(-1)
+        dir_mtimes = tuple(dir_mtimes)
+
+        key = str(repo_path)
+        cached = self._validate_cache.get(key)
+        if cached and cached[0] == dir_mtimes:
+            return cached[1]
+
+        required = {
+            ".": ["lab-metadata.yaml"],
+            "clab_tools_files": ["config.yaml", "nodes.csv", "connections.csv"],
+        }
+
         missing_files = []
-        for file_path in required_files:
-            full_path = repo_path / file_path
-            if not full_path.exists():
-                missing_files.append(file_path)
-        
+        for subdir, names in required.items():
+            dir_path = repo_path if subdir == "." else repo_path / subdir
+            try:
+                with os.scandir(dir_path) as entries:
+                    present = {entry.name for entry in entries}
+            except FileNotFoundError:
+                present = set()
+            for name in names:
+                if name not in present:
+                    missing_files.append(
+                        name if subdir == "." else f"{subdir}/{name}"
+                    )
+
         is_valid = len(missing_files) == 0
+        self._validate_cache[key] = (dir_mtimes, (is_valid, missing_files))
         return is_valid, missing_files
     
     def check_clab_tools(self) -> bool:
-        """Check if clab-tools is available"""
-        try:
-            result = self._run_command([self.clab_tools_cmd, "--version"])
-            return result.returncode == 0
-        except FileNotFoundError:
-            logger.error(f"clab-tools command '{self.clab_tools_cmd}' not found")
-            return False
\ No newline at end of file
+        """Check if clab-tools is available
+
+        shutil.which resolves PATH entirely in-process, so health-check
+        polling no longer forks a --version subprocess per request. A
+        hit also refreshes the resolved path used to exec clab-tools,
+        picking up a tool installed after startup.
+        """
+        resolved = shutil.which(self.clab_tools_cmd)
+        if resolved:
+            if resolved != self._resolved_cmd:
+                self._resolved_cmd = resolved
+                self._build_cmd_prefixes()
+            return True
+        logger.debug(f"clab-tools command '{self.clab_tools_cmd}' not found on PATH")
+        return False
\ No newline at end of file
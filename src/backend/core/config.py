@@ -1,17 +1,68 @@
 """
 Configuration management module
 """
+import copy
+import functools
 import yaml
+
+# tomllib landed in the stdlib in Python 3.11; on older interpreters the
+# TOML fast path is simply skipped and config.yaml stays authoritative
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
 from pathlib import Path
 from typing import Dict
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built against it;
+# fall back to the pure-Python implementations otherwise
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+def yaml_load(stream):
+    """Parse YAML from a stream or bytes with the fastest available loader"""
+    return yaml.load(stream, Loader=YamlLoader)
+
 # Default paths
 DEFAULT_CONFIG_DIR = Path.home() / ".labctl"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.yaml"
+DEFAULT_CONFIG_FILE_TOML = DEFAULT_CONFIG_DIR / "config.toml"
 DEFAULT_STATE_FILE = DEFAULT_CONFIG_DIR / "state.json"
 DEFAULT_REPOS_DIR = DEFAULT_CONFIG_DIR / "repos"
 DEFAULT_LOGS_DIR = DEFAULT_CONFIG_DIR / "logs"
 
+_DEFAULT_CONFIG = {
+    "repos_dir": str(DEFAULT_REPOS_DIR),
+    "logs_dir": str(DEFAULT_LOGS_DIR),
+    "state_file": str(DEFAULT_STATE_FILE),
+    "clab_tools_cmd": "clab-tools",
+    "git_cmd": "git",
+    "clab_tools_password": "",  # Set password for remote operations
+    "remote_credentials": {
+        "ssh_password": "",
+        "sudo_password": ""
+    },
+    "monitoring": {
+        "prometheus": "http://localhost:9090",
+        "grafana": "http://localhost:3000"
+    },
+    "netbox": {
+        "enabled": False,
+        "url": "",
+        "token": "",
+        "default_prefix": "10.100.100.0/24"
+    }
+}
+
+# Serialized once at import so the missing-config path is a single
+# write_bytes with no YAML emit at runtime
+_DEFAULT_CONFIG_YAML = yaml.dump(
+    _DEFAULT_CONFIG, Dumper=YamlDumper, default_flow_style=False
+).encode()
+
 
 def _deep_update(base: Dict, updates: Dict) -> None:
     """Recursively update nested dictionaries"""
@@ -22,58 +73,74 @@ def _deep_update(base: Dict, updates: Dict) -> None:
             base[key] = value
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime_ns: int) -> Dict:
+    """Parse a config file; the mtime in the key invalidates on edits"""
+    path = Path(path_str)
+    if path.suffix == '.toml':
+        if tomllib is None:
+            raise RuntimeError("TOML config requires Python 3.11 or newer")
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return yaml_load(f)
+
+
+def active_config_file() -> Path:
+    """The config file load_config reads by default
+
+    A config.toml next to the default config.yaml takes precedence when
+    the interpreter can parse it. TOML config is read-only (the stdlib
+    has no writer), so callers that write settings must check which file
+    is active before claiming an update took effect.
+    """
+    if tomllib is not None and DEFAULT_CONFIG_FILE_TOML.exists():
+        return DEFAULT_CONFIG_FILE_TOML
+    return DEFAULT_CONFIG_FILE
+
+
 def load_config(config_file: Path = None) -> Dict:
-    """Load configuration from file or create default"""
+    """Load configuration from file or create default
+
+    A config.toml next to the default config.yaml takes precedence:
+    tomllib is stdlib, C-backed, and parses faster at process start.
+    TOML config is read-only (the stdlib has no writer) — settings
+    updates via update_config keep operating on the YAML file.
+
+    The parsed result is memoized on (path, mtime), so repeated loads
+    within a process — every bootstrap calls this — skip the parse as
+    long as the file is unchanged on disk.
+    """
     if config_file is None:
-        config_file = DEFAULT_CONFIG_FILE
-    
-    if not config_file.exists():
-        # Create default config
+        config_file = active_config_file()
+
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        # Create default config from the pre-serialized constant; the
+        # caller gets a private copy so mutations never leak into it
         config_file.parent.mkdir(parents=True, exist_ok=True)
-        default_config = {
-            "repos_dir": str(DEFAULT_REPOS_DIR),
-            "logs_dir": str(DEFAULT_LOGS_DIR),
-            "state_file": str(DEFAULT_STATE_FILE),
-            "clab_tools_cmd": "clab-tools",
-            "git_cmd": "git",
-            "clab_tools_password": "",  # Set password for remote operations
-            "remote_credentials": {
-                "ssh_password": "",
-                "sudo_password": ""
-            },
-            "monitoring": {
-                "prometheus": "http://localhost:9090",
-                "grafana": "http://localhost:3000"
-            },
-            "netbox": {
-                "enabled": False,
-                "url": "",
-                "token": "",
-                "default_prefix": "10.100.100.0/24"
-            }
-        }
-        with open(config_file, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False)
-        return default_config
-    
-    with open(config_file) as f:
-        return yaml.safe_load(f)
+        config_file.write_bytes(_DEFAULT_CONFIG_YAML)
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+    return _load_cached(str(config_file), mtime_ns)
 
 
 def update_config(updates: Dict, config_file: Path = None) -> Dict:
     """Update configuration with new values"""
     if config_file is None:
         config_file = DEFAULT_CONFIG_FILE
-    
-    # Load current config
-    config = load_config(config_file)
-    
+
+    # Copy before mutating: load_config hands out the memoized parse,
+    # which other callers may still be holding
+    config = copy.deepcopy(load_config(config_file))
+
     # Update with new values
     _deep_update(config, updates)
     
     # Save updated config
     with open(config_file, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False)
     
     return config
 
@@ -85,4 +152,4 @@ def save_config(config: Dict, config_file: Path = None):
     
     config_file.parent.mkdir(parents=True, exist_ok=True)
     with open(config_file, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
\ No newline at end of file
+        yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False)
\ No newline at end of file
@@ -2,10 +2,20 @@
 Git operations module for lab repository management
 """
 import logging
+import os
+import shlex
+import shutil
 import subprocess
 from pathlib import Path
 from typing import List, Optional, Dict
 
+# pygit2 (libgit2 bindings) avoids a fork+exec per clone/pull; fall back
+# to the git CLI when it is not installed or a transport needs the CLI
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,14 +23,35 @@ class GitOperations:
     """Handles all Git-related operations for lab repositories"""
     
     def __init__(self, git_cmd: str = "git"):
-        self.git_cmd = git_cmd
+        # Resolve once so every execve gets an absolute path and skips
+        # the kernel-side PATH walk
+        self.git_cmd = git_cmd = shutil.which(git_cmd) or git_cmd
+        # Frozen argv templates for the fixed-shape commands so hot paths
+        # don't rebuild the same lists per call
+        self._cmd_pull = (git_cmd, "pull")
+        self._cmd_fetch_tags = (git_cmd, "fetch", "--tags")
+        self._cmd_tag_list = (git_cmd, "tag", "-l")
+        self._cmd_current_branch = (git_cmd, "rev-parse", "--abbrev-ref", "HEAD")
+        self._cmd_current_commit = (git_cmd, "rev-parse", "HEAD")
+        self._cmd_remote_url = (git_cmd, "config", "--get", "remote.origin.url")
+        self._cmd_clean = (git_cmd, "clean", "-fd")
+        self._git_repo_cache = set()  # paths confirmed to be git repos
+        self._pygit2_repos = {}  # path -> pygit2.Repository, for fork-free reads
     
-    def _run_command(self, cmd: List[str], cwd: Optional[Path] = None, 
+    def _run_command(self, cmd, cwd: Optional[Path] = None,
                      capture_output: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command and handle errors"""
-        logger.debug(f"Running command: {' '.join(cmd)}")
-        if cwd:
-            logger.debug(f"Working directory: {cwd}")
+        """Run a git command and handle errors
+
+        Keep these invocations free of preexec_fn, pass_fds and
+        shell=True so CPython can launch via posix_spawn (vfork) rather
+        than fork+exec where the interpreter supports it.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            # shlex.join quotes arguments with spaces, and only runs
+            # when DEBUG is actually enabled
+            logger.debug("Running command: %s", shlex.join(cmd))
+            if cwd:
+                logger.debug("Working directory: %s", cwd)
         
         result = subprocess.run(
             cmd, 
@@ -30,21 +61,82 @@ class GitOperations:
         )
         
         if result.returncode != 0:
-            logger.error(f"Command failed: {' '.join(cmd)}")
+            logger.error("Command failed: %s", shlex.join(cmd))
             if capture_output:
                 logger.error(f"Error output: {result.stderr}")
         
         return result
     
+    def _pygit2_repo(self, repo_path: Path):
+        """Cached pygit2 handle for read-only queries; None if unavailable
+
+        Opening the repository once and keeping the handle lets the
+        getters answer from libgit2 in-process instead of paying a git
+        fork per query.
+        """
+        if not pygit2:
+            return None
+        key = str(repo_path)
+        repo = self._pygit2_repos.get(key)
+        if repo is None:
+            try:
+                repo = pygit2.Repository(key)
+            except Exception:
+                return None
+            self._pygit2_repos[key] = repo
+        return repo
+
+    def _pygit2_callbacks(self):
+        """Remote callbacks that authenticate via the local SSH agent"""
+        return pygit2.RemoteCallbacks(
+            credentials=pygit2.KeypairFromAgent("git")
+        )
+
+    def _pygit2_pull(self, repo_path: Path) -> Optional[Dict]:
+        """Fetch and fast-forward in-process; returns None to fall back"""
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            remote = repo.remotes["origin"]
+            remote.fetch(callbacks=self._pygit2_callbacks())
+
+            branch = repo.head.shorthand
+            remote_ref = repo.lookup_reference(f"refs/remotes/origin/{branch}")
+            merge_result, _ = repo.merge_analysis(remote_ref.target)
+
+            if merge_result & pygit2.GIT_MERGE_ANALYSIS_UP_TO_DATE:
+                return {"success": True, "message": "Repository updated"}
+            if merge_result & pygit2.GIT_MERGE_ANALYSIS_FASTFORWARD:
+                repo.checkout_tree(repo.get(remote_ref.target))
+                repo.head.set_target(remote_ref.target)
+                return {"success": True, "message": "Repository updated"}
+
+            # Diverged history needs a real merge; let the git CLI handle it
+            return None
+        except Exception as e:
+            logger.debug(f"pygit2 pull failed ({e}), falling back to git CLI")
+            return None
+
     def clone(self, repo_url: str, target_path: Path) -> Dict:
         """Clone a repository to the specified path"""
         logger.info(f"Cloning repository {repo_url} to {target_path}...")
-        
+
         # Ensure parent directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # Always clone via the CLI: libgit2 has no partial-clone support,
+        # so the flags below beat an in-process full clone. Partial clone
+        # and parallel submodule fetches mean blobs are fetched on demand
+        # and submodule-heavy lab repos clone concurrently instead of one
+        # sub-clone at a time. pygit2 stays in use for pulls and the
+        # read-only queries.
         result = self._run_command(
-            [self.git_cmd, "clone", repo_url, str(target_path)]
+            [
+                self.git_cmd, "clone",
+                "--filter=blob:none",
+                "--recurse-submodules",
+                f"--jobs={os.cpu_count() or 4}",
+                repo_url, str(target_path)
+            ]
         )
         
         if result.returncode == 0:
@@ -52,14 +144,37 @@ class GitOperations:
         else:
             return {"success": False, "error": f"Git clone failed: {result.stderr}"}
     
+    def _remote_head_sha(self, repo_path: Path) -> Optional[str]:
+        """Look up origin's HEAD sha with a single ls-remote round trip"""
+        result = self._run_command(
+            [self.git_cmd, "ls-remote", "origin", "HEAD"], cwd=repo_path
+        )
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+
+        return result.stdout.split()[0]
+
     def pull(self, repo_path: Path) -> Dict:
         """Pull latest changes in a repository"""
         logger.info(f"Pulling latest changes in {repo_path}...")
         
         if not self.is_git_repo(repo_path):
             return {"success": False, "error": f"{repo_path} is not a git repository"}
-        
-        result = self._run_command([self.git_cmd, "pull"], cwd=repo_path)
+
+        # A HEAD comparison is one tiny round trip; when nothing changed
+        # upstream it skips object negotiation entirely
+        remote_sha = self._remote_head_sha(repo_path)
+        if remote_sha:
+            local = self._run_command(self._cmd_current_commit, cwd=repo_path)
+            if local.returncode == 0 and local.stdout.strip() == remote_sha:
+                return {"success": True, "message": "Repository already up to date"}
+
+        if pygit2:
+            result = self._pygit2_pull(repo_path)
+            if result is not None:
+                return result
+
+        result = self._run_command(self._cmd_pull, cwd=repo_path)
         
         if result.returncode == 0:
             return {"success": True, "message": "Repository updated"}
@@ -73,7 +188,7 @@ class GitOperations:
         if not self.is_git_repo(repo_path):
             return {"success": False, "error": f"{repo_path} is not a git repository"}
         
-        result = self._run_command([self.git_cmd, "fetch", "--tags"], cwd=repo_path)
+        result = self._run_command(self._cmd_fetch_tags, cwd=repo_path)
         
         if result.returncode == 0:
             return {"success": True, "message": "Tags fetched"}
@@ -98,11 +213,18 @@ class GitOperations:
         """Get all tags in a repository"""
         if not self.is_git_repo(repo_path):
             return []
-        
-        result = self._run_command(
-            [self.git_cmd, "tag", "-l"],
-            cwd=repo_path
-        )
+
+        repo = self._pygit2_repo(repo_path)
+        if repo is not None:
+            try:
+                return sorted(
+                    ref[len('refs/tags/'):] for ref in repo.references
+                    if ref.startswith('refs/tags/')
+                )
+            except Exception:
+                pass
+
+        result = self._run_command(self._cmd_tag_list, cwd=repo_path)
         
         if result.returncode == 0:
             return [tag.strip() for tag in result.stdout.strip().split('\n') if tag.strip()]
@@ -113,11 +235,15 @@ class GitOperations:
         """Get the current branch name"""
         if not self.is_git_repo(repo_path):
             return None
-        
-        result = self._run_command(
-            [self.git_cmd, "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=repo_path
-        )
+
+        repo = self._pygit2_repo(repo_path)
+        if repo is not None:
+            try:
+                return repo.head.shorthand
+            except Exception:
+                pass
+
+        result = self._run_command(self._cmd_current_branch, cwd=repo_path)
         
         if result.returncode == 0:
             return result.stdout.strip()
@@ -128,34 +254,89 @@ class GitOperations:
         """Get the current commit hash"""
         if not self.is_git_repo(repo_path):
             return None
-        
-        result = self._run_command(
-            [self.git_cmd, "rev-parse", "HEAD"],
-            cwd=repo_path
-        )
+
+        repo = self._pygit2_repo(repo_path)
+        if repo is not None:
+            try:
+                return str(repo.head.target)[:8]  # Return short hash
+            except Exception:
+                pass
+
+        result = self._run_command(self._cmd_current_commit, cwd=repo_path)
         
         if result.returncode == 0:
             return result.stdout.strip()[:8]  # Return short hash
         else:
             return None
     
+    def get_repo_info(self, repo_path: Path) -> Dict:
+        """Get tags, branch, commit and remote URL in one batched pass
+
+        Callers that want the full picture previously paid a git fork per
+        field plus an is_git_repo check each. This checks the repo once
+        and folds branch and commit into a single rev-parse invocation.
+        """
+        info = {"tags": [], "branch": None, "commit": None, "remote_url": None}
+
+        if not self.is_git_repo(repo_path):
+            return info
+
+        # rev-parse resolves both in one call; flags apply to the revs
+        # that follow them, so HEAD before --abbrev-ref yields the sha
+        # on the first output line and the branch name on the second
+        result = self._run_command(
+            [self.git_cmd, "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+            cwd=repo_path
+        )
+        if result.returncode == 0:
+            lines = result.stdout.split()
+            if len(lines) >= 2:
+                info["commit"] = lines[0][:8]  # Short hash
+                info["branch"] = lines[1]
+
+        result = self._run_command(self._cmd_tag_list, cwd=repo_path)
+        if result.returncode == 0:
+            info["tags"] = [
+                tag.strip() for tag in result.stdout.strip().split('\n')
+                if tag.strip()
+            ]
+
+        result = self._run_command(self._cmd_remote_url, cwd=repo_path)
+        if result.returncode == 0:
+            info["remote_url"] = result.stdout.strip()
+
+        return info
+
     def is_git_repo(self, path: Path) -> bool:
-        """Check if a path is a git repository"""
-        if not path.exists():
-            return False
-        
-        git_dir = path / ".git"
-        return git_dir.exists() and git_dir.is_dir()
+        """Check if a path is a git repository
+
+        One is_dir stat on .git replaces the old exists/exists/is_dir
+        triple. Positive answers are cached for the instance lifetime —
+        a directory that is a repo stays one — while negatives keep
+        re-checking so a fresh clone is noticed.
+        """
+        key = str(path)
+        if key in self._git_repo_cache:
+            return True
+
+        if (path / ".git").is_dir():
+            self._git_repo_cache.add(key)
+            return True
+        return False
     
     def get_remote_url(self, repo_path: Path) -> Optional[str]:
         """Get the remote origin URL"""
         if not self.is_git_repo(repo_path):
             return None
-        
-        result = self._run_command(
-            [self.git_cmd, "config", "--get", "remote.origin.url"],
-            cwd=repo_path
-        )
+
+        repo = self._pygit2_repo(repo_path)
+        if repo is not None:
+            try:
+                return repo.remotes['origin'].url
+            except Exception:
+                pass
+
+        result = self._run_command(self._cmd_remote_url, cwd=repo_path)
         
         if result.returncode == 0:
             return result.stdout.strip()
@@ -170,10 +351,7 @@ class GitOperations:
             return {"success": False, "error": f"{repo_path} is not a git repository"}
         
         # First, clean any untracked files
-        clean_result = self._run_command(
-            [self.git_cmd, "clean", "-fd"],
-            cwd=repo_path
-        )
+        clean_result = self._run_command(self._cmd_clean, cwd=repo_path)
         
         if clean_result.returncode != 0:
             logger.warning(f"Git clean failed: {clean_result.stderr}")
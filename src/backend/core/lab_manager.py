@@ -1,15 +1,30 @@
 """
 Lab management core functionality
 """
-import json
-import yaml
+import asyncio
+import atexit
+import copy
+import hashlib
+import orjson
+import os
 import uuid
 import threading
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, TYPE_CHECKING
 
+from .config import yaml_load
+from .clab_runner import new_deployment_id
+
+# Optional msgpack sidecar caches skip YAML parsing entirely on a hit
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 if TYPE_CHECKING:
     from .git_ops import GitOperations
     from .clab_runner import ClabRunner
@@ -18,6 +33,28 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _now_iso() -> str:
+    """ISO-8601 timestamp for state bookkeeping, built without tz lookups"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+def _start_async_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared asyncio loop that supervises long-running tasks"""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True, name='lab-async')
+    thread.start()
+    return loop
+
+
+# One loop thread supervises every deploy/teardown, so supervision no
+# longer costs a dedicated blocked thread per operation
+_async_loop = _start_async_loop()
+
+# Finished tasks beyond this count are evicted oldest-first, so a
+# long-running backend doesn't accumulate task records forever
+_MAX_TRACKED_TASKS = 256
+
+
 class LabManager:
     """Core lab management functionality"""
     
@@ -28,6 +65,33 @@ class LabManager:
         self.state = self._load_state()
         self._ensure_directories()
         self.active_tasks = {}  # Track async operations
+        # Bounded pool so bursty deploys reuse threads instead of spawning one each
+        self._deploy_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='deploy')
+        self._yaml_cache = {}  # path -> (mtime_ns, size, parsed) for metadata files
+        self._scenario_cache = {}  # lab_id -> (configs_dir mtime_ns, scenario list)
+        self._repo_paths = {}  # lab_id -> Path, built once per repo
+        # Reentrant so helpers that already hold the lock can call _save_state
+        self._state_lock = threading.RLock()  # Guards state/active_tasks across threads
+        self._repos_version = 0  # Bumped on any repo mutation
+        self._repos_cache = (None, -1)  # (cached list_repos result, version it was built at)
+        self._deploy_version = 0  # Bumped on any deployment mutation
+        self._status_cache = (None, -1)  # (cached get_status result, version it was built at)
+
+        # Redacted view for /api/config, built once up front. A deep copy
+        # here keeps the per-request path allocation-free and avoids the
+        # shallow-copy aliasing that let redaction clobber the live config
+        self.redacted_config = copy.deepcopy(config)
+        if self.redacted_config.get('netbox', {}).get('token'):
+            self.redacted_config['netbox']['token'] = '***'
+
+        # State writes are coalesced: mutations mark the state dirty and a
+        # background thread flushes at most every 250ms via atomic rename
+        self._state_dirty = threading.Event()
+        self._state_writer = threading.Thread(
+            target=self._state_writer_loop, daemon=True, name='state-writer'
+        )
+        self._state_writer.start()
+        atexit.register(self._flush_state)
         
         # Use injected dependencies or create defaults
         if git_ops:
@@ -61,18 +125,44 @@ class LabManager:
     def _load_state(self) -> Dict:
         """Load state file"""
         state_file = Path(self.config.get("state_file"))
-        if not state_file.exists():
+        # One open syscall instead of an exists() stat followed by a read
+        try:
+            return orjson.loads(state_file.read_bytes())
+        except FileNotFoundError:
             return {"repos": {}, "deployments": {}}
-        
-        with open(state_file) as f:
-            return json.load(f)
     
     def _save_state(self):
-        """Save state file"""
+        """Mark state dirty; the writer thread flushes it shortly after"""
+        self._state_dirty.set()
+
+    def _flush_state(self):
+        """Write state to disk atomically (tmp file + rename)"""
+        if not self._state_dirty.is_set():
+            return
+        self._state_dirty.clear()
+
         state_file = Path(self.config.get("state_file"))
         state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+
+        with self._state_lock:
+            data = orjson.dumps(self.state, option=orjson.OPT_INDENT_2)
+
+        tmp_file = state_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, state_file)
+
+    def _state_writer_loop(self):
+        """Background loop that debounces state writes to one per 250ms"""
+        while True:
+            self._state_dirty.wait()
+            time.sleep(0.25)  # let a burst of mutations settle
+            try:
+                self._flush_state()
+            except Exception as e:
+                logger.error(f"Failed to write state file: {e}")
     
     def _ensure_directories(self):
         """Ensure required directories exist"""
@@ -80,8 +170,78 @@ class LabManager:
             dir_path = Path(self.config.get(dir_key, ""))
             if dir_path:
                 dir_path.mkdir(parents=True, exist_ok=True)
-    
-    
+
+    def _load_yaml(self, path: Path) -> Dict:
+        """Parse a YAML file, reusing the cached result while it is unchanged
+
+        The cache is keyed on (mtime_ns, size) so a single stat call decides
+        whether the file needs to be re-read and re-parsed.
+        """
+        stat = path.stat()
+        key = str(path)
+        cached = self._yaml_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        raw = path.read_bytes()
+        parsed = self._load_sidecar(path, raw)
+        if parsed is None:
+            parsed = yaml_load(raw)
+            self._write_sidecar(path, raw, parsed)
+        self._yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+        return parsed
+
+    @staticmethod
+    def _sidecar_digest(raw: bytes) -> bytes:
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def _load_sidecar(self, path: Path, raw: bytes) -> Optional[Dict]:
+        """Read the msgpack sidecar if it matches the YAML content hash"""
+        if not msgpack:
+            return None
+        sidecar = path.with_suffix('.yaml.mpk')
+        try:
+            blob = sidecar.read_bytes()
+        except OSError:
+            return None
+        if blob[:16] != self._sidecar_digest(raw):
+            return None
+        try:
+            return msgpack.unpackb(blob[16:], raw=False)
+        except Exception:
+            return None
+
+    def _write_sidecar(self, path: Path, raw: bytes, parsed: Dict):
+        """Persist a binary sidecar cache next to the YAML file (0600)"""
+        if not msgpack:
+            return
+        sidecar = path.with_suffix('.yaml.mpk')
+        # Write-then-rename so a concurrent reader never sees a torn cache
+        tmp = sidecar.with_suffix('.mpk.tmp')
+        try:
+            blob = self._sidecar_digest(raw) + msgpack.packb(parsed)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp, sidecar)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not write metadata cache for {path}: {e}")
+
+
+    def _repo_path(self, lab_id: str) -> Path:
+        """Cached Path object for a registered repository
+
+        Rebuilding Path objects from the state string on every call adds
+        up in hot paths; the cache is verified against the state entry so
+        a re-added repo with a new location never serves a stale path.
+        """
+        path_str = self.state["repos"][lab_id]["path"]
+        path = self._repo_paths.get(lab_id)
+        if path is None or str(path) != path_str:
+            path = Path(path_str)
+            self._repo_paths[lab_id] = path
+        return path
+
     def add_repo(self, repo_url: str, name: Optional[str] = None) -> Dict:
         """Clone and register a lab repository"""
         # Extract repo name from URL if not provided
@@ -109,16 +269,17 @@ class LabManager:
                 "error": f"lab-metadata.yaml not found in {name}"
             }
         
-        with open(metadata_file) as f:
-            metadata = yaml.safe_load(f)
-        
+        metadata = self._load_yaml(metadata_file)
+
         # Update state
-        self.state["repos"][name] = {
-            "path": str(repo_path),
-            "url": repo_url,
-            "metadata": metadata,
-            "added": datetime.now().isoformat()
-        }
+        with self._state_lock:
+            self.state["repos"][name] = {
+                "path": str(repo_path),
+                "url": repo_url,
+                "metadata": metadata,
+                "added": _now_iso()
+            }
+            self._repos_version += 1
         self._save_state()
         
         return {
@@ -128,7 +289,15 @@ class LabManager:
         }
     
     def list_repos(self) -> List[Dict]:
-        """List all registered lab repositories"""
+        """List all registered lab repositories
+
+        The rebuilt list is memoized against a version counter that repo
+        mutations bump, so repeated GETs between mutations are a lookup.
+        """
+        cached, cached_version = self._repos_cache
+        if cached is not None and cached_version == self._repos_version:
+            return cached
+
         repos = []
         for repo_id, repo_info in self.state["repos"].items():
             metadata = repo_info.get("metadata", {})
@@ -145,30 +314,68 @@ class LabManager:
                 "path": repo_info["path"],
                 "url": repo_info["url"]
             })
+        self._repos_cache = (repos, self._repos_version)
         return repos
     
-    def update_repo(self, lab_id: str) -> Dict:
-        """Update a lab repository"""
+    def _update_repo(self, lab_id: str) -> Dict:
+        """Pull a repository and refresh its metadata without saving state"""
         if lab_id not in self.state["repos"]:
             return {"success": False, "error": f"Lab {lab_id} not found"}
-        
-        repo_path = Path(self.state["repos"][lab_id]["path"])
-        
+
+        repo_path = self._repo_path(lab_id)
+
         # Git pull using git_ops
         result = self.git_ops.pull(repo_path)
-        
+
         if not result["success"]:
             return result
-        
+
         # Reload metadata
         metadata_file = repo_path / "lab-metadata.yaml"
-        with open(metadata_file) as f:
-            metadata = yaml.safe_load(f)
-        
-        self.state["repos"][lab_id]["metadata"] = metadata
-        self._save_state()
-        
+        metadata = self._load_yaml(metadata_file)
+
+        with self._state_lock:
+            self.state["repos"][lab_id]["metadata"] = metadata
+            self._repos_version += 1
+        self._scenario_cache.pop(lab_id, None)
+
         return {"success": True, "message": "Repository updated"}
+
+    def update_repo(self, lab_id: str) -> Dict:
+        """Update a lab repository"""
+        result = self._update_repo(lab_id)
+
+        if result["success"]:
+            self._save_state()
+
+        return result
+
+    def update_all_repos(self, jobs: int = 8) -> Dict:
+        """Update all registered repositories, pulling in parallel
+
+        Git pulls are network/disk bound, so fanning them out across a
+        thread pool hides per-repo latency. State is flushed once after
+        all pulls complete instead of per repository.
+        """
+        lab_ids = list(self.state["repos"].keys())
+        if not lab_ids:
+            return {"success": True, "results": {}}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(jobs, len(lab_ids))) as executor:
+            futures = {
+                executor.submit(self._update_repo, lab_id): lab_id
+                for lab_id in lab_ids
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        self._save_state()
+
+        return {
+            "success": all(r["success"] for r in results.values()),
+            "results": results
+        }
     
     def remove_repo(self, lab_id: str) -> Dict:
         """Remove a lab repository"""
@@ -184,7 +391,11 @@ class LabManager:
                 }
         
         # Remove from state
-        del self.state["repos"][lab_id]
+        with self._state_lock:
+            del self.state["repos"][lab_id]
+            self._repos_version += 1
+        self._scenario_cache.pop(lab_id, None)
+        self._repo_paths.pop(lab_id, None)
         self._save_state()
         
         # Optionally remove directory
@@ -194,29 +405,59 @@ class LabManager:
         
         return {"success": True, "message": f"Lab {lab_id} removed"}
     
-    def deploy_lab_async(self, lab_id: str, version: Optional[str] = None, 
+    def deploy_lab_async(self, lab_id: str, version: Optional[str] = None,
                         allocate_ips: bool = False) -> str:
-        """Deploy a lab asynchronously"""
+        """Deploy a lab asynchronously on the shared deploy pool"""
         task_id = str(uuid.uuid4())
-        
-        def deploy_task():
+
+        with self._state_lock:
             self.active_tasks[task_id] = {
-                "status": "running",
+                "status": "queued",
                 "lab_id": lab_id,
-                "started": datetime.now().isoformat()
+                "submitted": _now_iso()
             }
-            
-            result = self._deploy_lab(lab_id, version, allocate_ips)
-            
-            self.active_tasks[task_id]["status"] = "completed"
-            self.active_tasks[task_id]["result"] = result
-            self.active_tasks[task_id]["completed"] = datetime.now().isoformat()
-        
-        thread = threading.Thread(target=deploy_task)
-        thread.start()
-        
+            self._prune_tasks()
+
+        async def deploy_task():
+            with self._state_lock:
+                self.active_tasks[task_id]["status"] = "running"
+                self.active_tasks[task_id]["started"] = _now_iso()
+
+            # The blocking clab-tools work still runs on the bounded deploy
+            # pool; the coroutine just supervises it from the shared loop
+            result = await _async_loop.run_in_executor(
+                self._deploy_pool, self._deploy_lab, lab_id, version, allocate_ips
+            )
+
+            with self._state_lock:
+                self.active_tasks[task_id]["status"] = "completed"
+                self.active_tasks[task_id]["result"] = result
+                self.active_tasks[task_id]["completed"] = _now_iso()
+
+        self.active_tasks[task_id]["future"] = asyncio.run_coroutine_threadsafe(
+            deploy_task(), _async_loop
+        )
+
         return task_id
-    
+
+    def _prune_tasks(self):
+        """Evict the oldest finished tasks once the tracker exceeds its cap
+
+        Caller must hold the state lock. Running and queued tasks are
+        never evicted regardless of the cap; dicts preserve insertion
+        order, so the first finished entries are also the oldest.
+        """
+        excess = len(self.active_tasks) - _MAX_TRACKED_TASKS
+        if excess <= 0:
+            return
+
+        finished = [
+            tid for tid, info in self.active_tasks.items()
+            if info.get("status") in ("completed", "failed")
+        ]
+        for tid in finished[:excess]:
+            del self.active_tasks[tid]
+
     def _deploy_lab(self, lab_id: str, version: Optional[str] = None, 
                     allocate_ips: bool = False) -> Dict:
         """Deploy a lab using clab-tools"""
@@ -224,7 +465,7 @@ class LabManager:
             return {"success": False, "error": f"Lab {lab_id} not found"}
         
         repo_info = self.state["repos"][lab_id]
-        repo_path = Path(repo_info["path"])
+        repo_path = self._repo_path(lab_id)
         
         # Checkout specific version if requested
         if version and version != "latest":
@@ -269,8 +510,7 @@ class LabManager:
                 logger.info(f"Allocated {len(ip_assignments)} IPs from NetBox")
         
         # Deploy lab using clab_runner
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        deployment_id = f"{lab_id}_{timestamp}"
+        deployment_id = new_deployment_id(lab_id)
         
         logger.info(f"Deploying lab {lab_id}...")
         
@@ -291,15 +531,19 @@ class LabManager:
                 logger.info(f"Registered {len(created_devices)} devices in NetBox")
             
             # Update deployment state
-            self.state["deployments"][deployment_id] = {
-                "lab_id": lab_id,
-                "version": version or "latest",
-                "deployed_at": datetime.now().isoformat(),
-                "log_file": result["log_file"],
-                "status": "active",
-                "netbox_ips_allocated": bool(ip_assignments),
-                "ip_assignments": ip_assignments
-            }
+            with self._state_lock:
+                self.state["deployments"][deployment_id] = {
+                    "lab_id": lab_id,
+                    "version": version or "latest",
+                    "deployed_at": _now_iso(),
+                    "log_file": result["log_file"],
+                    "status": "active",
+                    "netbox_ips_allocated": bool(ip_assignments),
+                    "ip_assignments": ip_assignments
+                }
+                # O(1) pointer for the logs endpoint instead of a sorted scan
+                self.state.setdefault("latest_deployment", {})[lab_id] = deployment_id
+                self._deploy_version += 1
             self._save_state()
             
             return {
@@ -329,9 +573,8 @@ class LabManager:
         
         if not active_deployment:
             return {"success": False, "error": f"No active deployment found for {lab_id}"}
-        
-        repo_info = self.state["repos"][lab_id]
-        repo_path = Path(repo_info["path"])
+
+        repo_path = self._repo_path(lab_id)
         
         # Teardown lab using clab_runner
         logger.info(f"Destroying lab {lab_id}...")
@@ -357,8 +600,10 @@ class LabManager:
                     logger.warning("Failed to unregister some NetBox devices")
             
             # Update deployment state
-            self.state["deployments"][active_deployment]["status"] = "destroyed"
-            self.state["deployments"][active_deployment]["destroyed_at"] = datetime.now().isoformat()
+            with self._state_lock:
+                self.state["deployments"][active_deployment]["status"] = "destroyed"
+                self.state["deployments"][active_deployment]["destroyed_at"] = _now_iso()
+                self._deploy_version += 1
             self._save_state()
             
             return {
@@ -372,7 +617,15 @@ class LabManager:
             }
     
     def get_status(self) -> Dict:
-        """Get status of all deployments"""
+        """Get status of all deployments
+
+        The built response is reused until a deploy or teardown bumps the
+        deployment version, so status polls don't rebuild the view.
+        """
+        cached, cached_version = self._status_cache
+        if cached is not None and cached_version == self._deploy_version:
+            return cached
+
         active_deployments = []
         for dep_id, dep_info in self.state["deployments"].items():
             if dep_info["status"] == "active":
@@ -385,35 +638,53 @@ class LabManager:
                     "deployed_at": dep_info["deployed_at"]
                 })
         
-        return {
+        status = {
             "deployments": active_deployments,
             "total": len(active_deployments)
         }
+        self._status_cache = (status, self._deploy_version)
+        return status
     
     def get_task_status(self, task_id: str) -> Dict:
         """Get status of an async task"""
-        if task_id not in self.active_tasks:
-            return {"error": "Task not found"}
-        
-        return self.active_tasks[task_id]
+        with self._state_lock:
+            if task_id not in self.active_tasks:
+                return {"error": "Task not found"}
+            task = self.active_tasks[task_id]
+            status = {k: v for k, v in task.items() if k != "future"}
+        future = task.get("future")
+        if future is not None:
+            status["running"] = future.running()
+            status["done"] = future.done()
+        return status
     
     def list_config_scenarios(self, lab_id: str) -> List[str]:
         """List available configuration scenarios for a lab"""
         if lab_id not in self.state["repos"]:
             return []
         
-        repo_path = Path(self.state["repos"][lab_id]["path"])
+        repo_path = self._repo_path(lab_id)
         configs_dir = repo_path / "device_configs"
-        
+
         if not configs_dir.exists():
             return []
-        
-        scenarios = []
-        for item in configs_dir.iterdir():
-            if item.is_dir() and item.name != "__pycache__":
-                scenarios.append(item.name)
-        
-        return sorted(scenarios)
+
+        # Directory mtime changes whenever scenarios are added or removed,
+        # so an unchanged mtime means the cached listing is still good
+        mtime = configs_dir.stat().st_mtime_ns
+        cached = self._scenario_cache.get(lab_id)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        # os.scandir answers is_dir() from the directory read itself,
+        # avoiding a separate stat per entry
+        with os.scandir(configs_dir) as entries:
+            scenarios = sorted(
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False) and entry.name != "__pycache__"
+            )
+        self._scenario_cache[lab_id] = (mtime, scenarios)
+        return scenarios
     
     def apply_config_scenario(self, lab_id: str, scenario: str) -> Dict:
         """Apply a configuration scenario to a deployed lab"""
@@ -430,7 +701,7 @@ class LabManager:
         if not is_deployed:
             return {"success": False, "error": f"Lab {lab_id} is not deployed"}
         
-        repo_path = Path(self.state["repos"][lab_id]["path"])
+        repo_path = self._repo_path(lab_id)
         scenario_dir = repo_path / "device_configs" / scenario
         
         if not scenario_dir.exists():
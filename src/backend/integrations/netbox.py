@@ -36,6 +36,7 @@ class NetBoxManager:
         self.config = config
         self.enabled = config.get('enabled', False)
         self._api = None
+        self._defaults_cache = None  # (site, role, device_type) lookup memo
         
         if self.enabled and not NETBOX_AVAILABLE:
             logger.error("NetBox integration enabled but pynetbox not installed")
@@ -224,82 +225,54 @@ class NetBoxManager:
             return []
             
         created_devices = []
-        site_name = self.config.get('default_site', 'Lab Environment')
-        role_name = self.config.get('default_role', 'Lab Device')
-        
+
         try:
-            # Get or create site
-            site = self.api.dcim.sites.get(name=site_name)
-            if not site:
-                site = self.api.dcim.sites.create(
-                    name=site_name,
-                    slug=site_name.lower().replace(' ', '-')
-                )
-                
-            # Get or create device role
-            role = self.api.dcim.device_roles.get(name=role_name)
-            if not role:
-                role = self.api.dcim.device_roles.create(
-                    name=role_name,
-                    slug=role_name.lower().replace(' ', '-'),
-                    color='0066cc'
-                )
-                
-            # Get or create device type (generic)
-            device_type = self.api.dcim.device_types.get(model='Generic Lab Device')
-            if not device_type:
-                # First ensure manufacturer exists
-                manufacturer = self.api.dcim.manufacturers.get(name='Generic')
-                if not manufacturer:
-                    manufacturer = self.api.dcim.manufacturers.create(
-                        name='Generic',
-                        slug='generic'
-                    )
-                    
-                device_type = self.api.dcim.device_types.create(
-                    manufacturer=manufacturer.id,
-                    model='Generic Lab Device',
-                    slug='generic-lab-device',
-                    u_height=0  # 0U for virtual devices
-                )
-                
-            # Create devices
+            site, role, device_type = self._get_lab_defaults()
+
+            # One filter call finds every pre-existing device instead of
+            # a GET per node
+            node_names = {}
             for node in nodes:
                 node_name = node.get('hostname', node.get('name', ''))
-                device_name = f"{lab_id}-{node_name}"
-                
-                try:
-                    # Check if device already exists
-                    existing = self.api.dcim.devices.get(name=device_name)
-                    if existing:
-                        logger.warning(f"Device {device_name} already exists")
-                        continue
-                        
-                    # Create device
-                    device_data = {
-                        "name": device_name,
-                        "device_type": device_type.id,
-                        "device_role": role.id,
-                        "site": site.id,
-                        "status": "active",
-                        "comments": f"Lab: {lab_name} ({lab_id})",
-                        "tags": [{"name": "lab-managed"}, {"name": f"lab-{lab_id}"}]
-                    }
-                    
-                    device = self.api.dcim.devices.create(**device_data)
-                    created_devices.append(device_name)
-                    
+                node_names[f"{lab_id}-{node_name}"] = node
+
+            existing_names = {
+                device.name for device in
+                self.api.dcim.devices.filter(name=list(node_names))
+            }
+            for device_name in existing_names & set(node_names):
+                logger.warning(f"Device {device_name} already exists")
+
+            # Batch all creations into a single request; pynetbox POSTs a
+            # list of device payloads in one round-trip
+            batch = [
+                {
+                    "name": device_name,
+                    "device_type": device_type.id,
+                    "device_role": role.id,
+                    "site": site.id,
+                    "status": "active",
+                    "comments": f"Lab: {lab_name} ({lab_id})",
+                    "tags": [{"name": "lab-managed"}, {"name": f"lab-{lab_id}"}]
+                }
+                for device_name in node_names
+                if device_name not in existing_names
+            ]
+
+            if batch:
+                devices = self.api.dcim.devices.create(batch)
+                for device in devices:
+                    created_devices.append(device.name)
+
                     # If device has an IP, associate it
-                    if 'mgmt_ip' in node and node['mgmt_ip']:
+                    node = node_names.get(device.name, {})
+                    if node.get('mgmt_ip'):
                         self._associate_ip_to_device(device, node['mgmt_ip'])
-                        
-                    logger.info(f"Registered device {device_name} in NetBox")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to register device {device_name}: {e}")
-                    
+
+                    logger.info(f"Registered device {device.name} in NetBox")
+
             return created_devices
-            
+
         except Exception as e:
             logger.error(f"Device registration failed: {e}")
             return created_devices
@@ -381,6 +354,56 @@ class NetBoxManager:
             
         return len(errors) == 0, errors
     
+    def _get_lab_defaults(self):
+        """Get or create the lab site, role, and device type
+
+        The three lookups cost an HTTP round-trip each, so the resolved
+        objects are memoized for the lifetime of the manager.
+        """
+        if self._defaults_cache is not None:
+            return self._defaults_cache
+
+        site_name = self.config.get('default_site', 'Lab Environment')
+        role_name = self.config.get('default_role', 'Lab Device')
+
+        # Get or create site
+        site = self.api.dcim.sites.get(name=site_name)
+        if not site:
+            site = self.api.dcim.sites.create(
+                name=site_name,
+                slug=site_name.lower().replace(' ', '-')
+            )
+
+        # Get or create device role
+        role = self.api.dcim.device_roles.get(name=role_name)
+        if not role:
+            role = self.api.dcim.device_roles.create(
+                name=role_name,
+                slug=role_name.lower().replace(' ', '-'),
+                color='0066cc'
+            )
+
+        # Get or create device type (generic)
+        device_type = self.api.dcim.device_types.get(model='Generic Lab Device')
+        if not device_type:
+            # First ensure manufacturer exists
+            manufacturer = self.api.dcim.manufacturers.get(name='Generic')
+            if not manufacturer:
+                manufacturer = self.api.dcim.manufacturers.create(
+                    name='Generic',
+                    slug='generic'
+                )
+
+            device_type = self.api.dcim.device_types.create(
+                manufacturer=manufacturer.id,
+                model='Generic Lab Device',
+                slug='generic-lab-device',
+                u_height=0  # 0U for virtual devices
+            )
+
+        self._defaults_cache = (site, role, device_type)
+        return self._defaults_cache
+
     def _rollback_allocations(self, allocated_ips: List):
         """Rollback IP allocations on failure"""
         for ip in allocated_ips:
@@ -0,0 +1,30 @@
+"""
+Common helpers for backend modules
+"""
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """App-wide JSON provider backed by orjson
+
+    Makes every jsonify() call site serialize with orjson instead of the
+    stdlib encoder; hot endpoints still use json_response directly to
+    skip provider dispatch.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def json_response(obj, status: int = 200) -> Response:
+    """Serialize a response body with orjson instead of Flask's jsonify
+
+    orjson serializes straight to bytes in C, which keeps hot read
+    endpoints off the stdlib json encoder.
+    """
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
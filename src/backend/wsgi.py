@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers
+
+The Werkzeug dev server in app.py serializes every request; run the
+backend under gunicorn with threaded workers instead:
+
+    gunicorn -k gthread -w 2 --threads 8 src.backend.wsgi:app
+"""
+from .app import create_app
+
+app = create_app()
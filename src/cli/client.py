@@ -1,13 +1,24 @@
 """
 API client for labctl backend communication
 """
+import json
+import os
+import time
 import requests
 import sys
+from pathlib import Path
 from typing import Dict, Optional
 from rich.console import Console
 
 console = Console()
 
+# A recent successful health check is remembered here so scripted
+# invocations don't pay an extra HTTP round-trip per command
+HEALTH_CACHE_FILE = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'labctl' / 'health.json'
+HEALTH_CACHE_TTL = 30
+
 
 class LabCtlClient:
     """API client for labctl backend"""
@@ -37,12 +48,41 @@ class LabCtlClient:
             sys.exit(1)
     
     def health_check(self) -> bool:
-        """Check if backend is healthy"""
+        """Check if backend is healthy
+
+        A healthy result is cached on disk for HEALTH_CACHE_TTL seconds
+        (per api_url) so back-to-back CLI invocations skip the extra
+        round-trip; failures are never cached.
+        """
+        if self._cached_healthy():
+            return True
         try:
             response = self._request('GET', '/api/health')
-            return response.json().get('status') == 'healthy'
+            healthy = response.json().get('status') == 'healthy'
         except:
             return False
+        if healthy:
+            self._cache_healthy()
+        return healthy
+
+    def _cached_healthy(self) -> bool:
+        """Return True if a fresh healthy result is cached for this api_url"""
+        try:
+            with open(HEALTH_CACHE_FILE) as f:
+                cache = json.load(f)
+            return (cache.get('api_url') == self.api_url
+                    and time.time() - cache.get('timestamp', 0) < HEALTH_CACHE_TTL)
+        except (OSError, ValueError):
+            return False
+
+    def _cache_healthy(self):
+        """Record a healthy backend check; best-effort only"""
+        try:
+            HEALTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(HEALTH_CACHE_FILE, 'w') as f:
+                json.dump({'api_url': self.api_url, 'timestamp': time.time()}, f)
+        except OSError:
+            pass
     
     # Repository management methods
     def list_repos(self) -> list:
@@ -62,6 +102,15 @@ class LabCtlClient:
         """Update a lab repository"""
         response = self._request('PUT', f'/api/repos/{lab_id}')
         return response.json()
+
+    def update_all_repos(self) -> dict:
+        """Update every lab repository in one backend call
+
+        The backend pulls the repos in parallel, so this is one round-trip
+        instead of a serial PUT per repository.
+        """
+        response = self._request('POST', '/api/repos/refresh')
+        return response.json()
     
     def remove_repo(self, lab_id: str) -> dict:
         """Remove a lab repository"""
@@ -93,6 +142,18 @@ class LabCtlClient:
         """Get task status"""
         response = self._request('GET', f'/api/tasks/{task_id}')
         return response.json()
+
+    def stream_task_events(self, task_id: str):
+        """Yield task status updates from the backend SSE stream
+
+        Each event is a decoded status dict; the stream ends when the
+        backend has emitted the final (completed/failed) status.
+        """
+        import json as _json
+        response = self._request('GET', f'/api/tasks/{task_id}/events', stream=True)
+        for line in response.iter_lines(decode_unicode=True):
+            if line and line.startswith('data: '):
+                yield _json.loads(line[len('data: '):])
     
     # Configuration management methods
     def list_scenarios(self, lab_id: str) -> list:
@@ -105,10 +166,22 @@ class LabCtlClient:
         response = self._request('POST', f'/api/labs/{lab_id}/scenarios/{scenario}')
         return response.json()
     
-    def get_logs(self, lab_id: str) -> dict:
-        """Get deployment logs"""
-        response = self._request('GET', f'/api/logs/{lab_id}')
-        return response.json()
+    def get_logs(self, lab_id: str, tail: Optional[int] = None) -> dict:
+        """Get deployment logs
+
+        The backend streams the log as text/plain with the deployment id
+        in the X-Deployment-Id header; errors still come back as JSON.
+        Pass tail to fetch only the last N lines server-side.
+        """
+        params = {'tail': tail} if tail else None
+        response = self._request('GET', f'/api/logs/{lab_id}', stream=True, params=params)
+        if response.headers.get('Content-Type', '').startswith('application/json'):
+            return response.json()
+        return {
+            'deployment_id': response.headers.get('X-Deployment-Id', 'unknown'),
+            'log': ''.join(chunk for chunk in response.iter_content(
+                chunk_size=65536, decode_unicode=True))
+        }
     
     def get_config(self) -> dict:
         """Get current backend configuration"""
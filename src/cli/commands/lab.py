@@ -4,7 +4,6 @@ Lab deployment and management CLI commands
 import click
 import json
 import sys
-import time
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -38,20 +37,19 @@ def deploy(ctx, lab_id, version, allocate_ips):
         console=console
     ) as progress:
         task = progress.add_task("Deploying lab...", total=None)
-        
-        while True:
-            status = client.get_task_status(task_id)
-            
-            if status.get('status') == 'completed':
+
+        # The SSE stream pushes state transitions, so we block until the
+        # backend reports a terminal state instead of polling on a timer
+        final_status = {}
+        for status in client.stream_task_events(task_id):
+            final_status = status
+            if status.get('status') in ('completed', 'failed'):
                 break
-            elif status.get('status') == 'failed':
-                console.print(f"[red]✗ Deployment failed[/red]")
-                sys.exit(1)
-            
-            time.sleep(2)
-    
-    # Get final result
-    final_status = client.get_task_status(task_id)
+
+        if final_status.get('status') == 'failed':
+            console.print(f"[red]✗ Deployment failed[/red]")
+            sys.exit(1)
+
     final_result = final_status.get('result', {})
     
     if final_result.get('success'):
@@ -118,11 +116,12 @@ def status(ctx, output_json):
 
 @click.command()
 @click.argument('lab_id')
+@click.option('--tail', '-n', type=int, default=None, help='Show only the last N lines')
 @click.pass_context
-def logs(ctx, lab_id):
+def logs(ctx, lab_id, tail):
     """Show deployment logs for a lab"""
     client = ctx.obj['client']
-    result = client.get_logs(lab_id)
+    result = client.get_logs(lab_id, tail=tail)
     
     if 'error' in result:
         console.print(f"[red]✗ {result['error']}[/red]")
@@ -73,12 +73,34 @@ def list(ctx, output_json):
 
 
 @repo.command()
-@click.argument('lab_id')
+@click.argument('lab_id', required=False)
+@click.option('--all', 'update_all', is_flag=True, help='Update all repositories')
 @click.pass_context
-def update(ctx, lab_id):
+def update(ctx, lab_id, update_all):
     """Update a lab repository (git pull)"""
     client = ctx.obj['client']
-    
+
+    if update_all or not lab_id:
+        # One backend call; the pulls run in parallel server-side
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Updating all repositories...", total=None)
+            result = client.update_all_repos()
+
+        failed = False
+        for repo_id, repo_result in sorted(result.get('results', {}).items()):
+            if repo_result.get('success'):
+                console.print(f"[green]✓ {repo_id}: {repo_result.get('message', 'updated')}[/green]")
+            else:
+                console.print(f"[red]✗ {repo_id}: {repo_result.get('error', 'update failed')}[/red]")
+                failed = True
+        if failed:
+            sys.exit(1)
+        return
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -86,7 +108,7 @@ def update(ctx, lab_id):
     ) as progress:
         task = progress.add_task(f"Updating {lab_id}...", total=None)
         result = client.update_repo(lab_id)
-    
+
     if result.get('success'):
         console.print(f"[green]✓ {result['message']}[/green]")
     else:
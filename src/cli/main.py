@@ -19,18 +19,21 @@ DEFAULT_API_URL = "http://localhost:5001"
 
 
 @click.group()
-@click.option('--api-url', '-a', 
+@click.option('--api-url', '-a',
               default=DEFAULT_API_URL,
               envvar='LABCTL_API_URL',
               help='Backend API URL')
+@click.option('--no-health-check', is_flag=True,
+              help='Skip the backend health check')
 @click.pass_context
-def cli(ctx, api_url):
+def cli(ctx, api_url, no_health_check):
     """Homelab Manager CLI - Manage containerlab-based network labs"""
     ctx.ensure_object(dict)
     ctx.obj['client'] = LabCtlClient(api_url)
-    
+
     # Only check backend health if we're running an actual command (not help)
-    if ctx.invoked_subcommand and ctx.invoked_subcommand not in ['--help', '-h']:
+    if not no_health_check and ctx.invoked_subcommand and \
+            ctx.invoked_subcommand not in ['--help', '-h']:
         if not ctx.obj['client'].health_check():
             console.print(f"[red]Error: Backend is not healthy at {api_url}[/red]")
             console.print("[yellow]Start the backend with: python app.py[/yellow]")
@@ -5,6 +5,7 @@ import unittest
 import json
 import tempfile
 import shutil
+from concurrent.futures import TimeoutError as FutureTimeout
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -129,6 +130,35 @@ class TestAPIEndpoints(unittest.TestCase):
             self.assertTrue(data['success'])
             self.assertEqual(data['message'], 'Repository updated')
     
+    def test_refresh_repos(self):
+        """Test refreshing all repositories"""
+        with self.app.app_context():
+            self.app.lab_manager.update_all_repos = Mock(return_value={
+                'success': True,
+                'results': {'test-lab': {'success': True, 'message': 'Repository updated'}}
+            })
+
+            response = self.client.post('/api/repos/refresh')
+
+            self.assertEqual(response.status_code, 200)
+            data = json.loads(response.data)
+            self.assertTrue(data['success'])
+            self.assertIn('test-lab', data['results'])
+
+    def test_refresh_repos_partial_failure(self):
+        """Test refresh reporting a failed repository"""
+        with self.app.app_context():
+            self.app.lab_manager.update_all_repos = Mock(return_value={
+                'success': False,
+                'results': {'test-lab': {'success': False, 'error': 'Git pull failed'}}
+            })
+
+            response = self.client.post('/api/repos/refresh')
+
+            self.assertEqual(response.status_code, 400)
+            data = json.loads(response.data)
+            self.assertFalse(data['success'])
+
     def test_deploy_lab(self):
         """Test lab deployment"""
         with self.app.app_context():
@@ -167,6 +197,63 @@ class TestAPIEndpoints(unittest.TestCase):
             self.assertEqual(len(data['deployments']), 1)
             self.assertEqual(data['deployments'][0]['lab_id'], 'test-lab')
     
+    def test_get_logs_tail(self):
+        """Test ?tail= returns only the last N log lines"""
+        log_file = self.logs_dir / 'test-lab_20230101_120000.log'
+        log_file.write_text('\n'.join(f'line{i}' for i in range(10)) + '\n')
+
+        with self.app.app_context():
+            self.app.lab_manager.state = {
+                'repos': {},
+                'deployments': {
+                    'test-lab_20230101_120000': {
+                        'lab_id': 'test-lab',
+                        'status': 'active',
+                        'log_file': str(log_file)
+                    }
+                },
+                'latest_deployment': {'test-lab': 'test-lab_20230101_120000'}
+            }
+
+            response = self.client.get('/api/logs/test-lab?tail=3')
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, b'line7\nline8\nline9\n')
+            self.assertEqual(response.headers['X-Deployment-Id'],
+                             'test-lab_20230101_120000')
+
+    def test_get_logs_not_found(self):
+        """Test logs for a lab with no deployments"""
+        with self.app.app_context():
+            self.app.lab_manager.state = {'repos': {}, 'deployments': {}}
+
+            response = self.client.get('/api/logs/unknown-lab')
+
+            self.assertEqual(response.status_code, 404)
+            data = json.loads(response.data)
+            self.assertIn('error', data)
+
+    def test_batch_endpoint(self):
+        """Test batched dispatch of GET paths"""
+        response = self.client.post('/api/batch',
+                                  json=['/api/health', '/not-api/path'],
+                                  content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(data['/api/health']['status'], 'healthy')
+        self.assertIn('error', data['/not-api/path'])
+
+    def test_batch_endpoint_rejects_non_list(self):
+        """Test batch endpoint with a non-list body"""
+        response = self.client.post('/api/batch',
+                                  json={'path': '/api/health'},
+                                  content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.data)
+        self.assertIn('error', data)
+
     def test_get_task_status(self):
         """Test getting task status"""
         with self.app.app_context():
@@ -182,6 +269,66 @@ class TestAPIEndpoints(unittest.TestCase):
             self.assertEqual(data['status'], 'completed')
             self.assertTrue(data['result']['success'])
     
+    def test_get_task_status_long_poll_timeout(self):
+        """Test ?wait= long-poll returns 204 when the task doesn't finish"""
+        with self.app.app_context():
+            self.app.lab_manager.get_task_status = Mock(return_value={'status': 'running'})
+            future = Mock()
+            future.result.side_effect = FutureTimeout()
+            self.app.lab_manager.active_tasks = {'task-123': {'future': future}}
+
+            response = self.client.get('/api/tasks/task-123?wait=1')
+
+            self.assertEqual(response.status_code, 204)
+
+    def test_get_task_status_long_poll_completion(self):
+        """Test ?wait= long-poll returns the refreshed terminal status"""
+        with self.app.app_context():
+            self.app.lab_manager.get_task_status = Mock(side_effect=[
+                {'status': 'running'},
+                {'status': 'completed', 'result': {'success': True}}
+            ])
+            future = Mock()
+            future.result.return_value = None
+            self.app.lab_manager.active_tasks = {'task-123': {'future': future}}
+
+            response = self.client.get('/api/tasks/task-123?wait=1')
+
+            self.assertEqual(response.status_code, 200)
+            data = json.loads(response.data)
+            self.assertEqual(data['status'], 'completed')
+
+    def test_task_events_terminal_status(self):
+        """Test SSE stream ends with a terminal-status event"""
+        with self.app.app_context():
+            self.app.lab_manager.get_task_status = Mock(side_effect=[
+                {'status': 'running'},
+                {'status': 'completed', 'result': {'success': True}}
+            ])
+            future = Mock()
+            future.done.return_value = False
+            future.result.return_value = None
+            self.app.lab_manager.active_tasks = {'task-123': {'future': future}}
+
+            response = self.client.get('/api/tasks/task-123/events')
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.mimetype, 'text/event-stream')
+            events = [line for line in response.data.split(b'\n\n')
+                      if line.startswith(b'data: ')]
+            self.assertEqual(len(events), 2)
+            final = json.loads(events[-1][len(b'data: '):])
+            self.assertEqual(final['status'], 'completed')
+
+    def test_task_events_not_found(self):
+        """Test SSE stream for non-existent task"""
+        with self.app.app_context():
+            self.app.lab_manager.get_task_status = Mock(return_value={'error': 'Task not found'})
+
+            response = self.client.get('/api/tasks/nonexistent/events')
+
+            self.assertEqual(response.status_code, 404)
+
     def test_get_task_status_not_found(self):
         """Test getting status of non-existent task"""
         with self.app.app_context():
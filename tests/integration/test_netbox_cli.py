@@ -109,15 +109,15 @@ class TestNetBoxCLICommands:
             'task_id': 'test-task-123'
         }
         
-        # Mock task status - completed
-        mock_client.get_task_status.return_value = {
+        # Mock task event stream - completed
+        mock_client.stream_task_events.return_value = iter([{
             'status': 'completed',
             'result': {
                 'success': True,
                 'message': 'Lab deployed successfully',
                 'deployment_id': 'test-lab-deployment'
             }
-        }
+        }])
         
         # Test deploy command with IP allocation
         with patch('src.cli.main.LabCtlClient', return_value=mock_client):
@@ -136,15 +136,15 @@ class TestNetBoxCLICommands:
             'task_id': 'test-task-123'
         }
         
-        # Mock task status - completed
-        mock_client.get_task_status.return_value = {
+        # Mock task event stream - completed
+        mock_client.stream_task_events.return_value = iter([{
             'status': 'completed',
             'result': {
                 'success': True,
                 'message': 'Lab deployed successfully',
                 'deployment_id': 'test-lab-deployment'
             }
-        }
+        }])
         
         # Test deploy command without IP allocation
         with patch('src.cli.main.LabCtlClient', return_value=mock_client):
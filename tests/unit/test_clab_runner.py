@@ -1,6 +1,7 @@
 """
 Unit tests for ClabRunner module
 """
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from pathlib import Path
@@ -84,18 +85,35 @@ class TestClabRunner(unittest.TestCase):
     def test_get_node_list(self):
         """Test getting node list from nodes.csv"""
         csv_content = "name,type,image\nrouter1,ceos,ceos:latest\nrouter2,ceos,ceos:latest"
-        
-        with patch('builtins.open', mock_open(read_data=csv_content)):
-            with patch('pathlib.Path.exists', return_value=True):
-                nodes = self.clab_runner.get_node_list('test-lab', Path('/tmp/test-repo'))
-        
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_path = Path(tmp)
+            clab_dir = repo_path / 'clab_tools_files'
+            clab_dir.mkdir()
+            (clab_dir / 'nodes.csv').write_text(csv_content)
+
+            nodes = self.clab_runner.get_node_list('test-lab', repo_path)
+
+            # Second call with an unchanged file is served from cache
+            with patch('builtins.open', side_effect=AssertionError) as reopen:
+                cached_nodes = self.clab_runner.get_node_list('test-lab', repo_path)
+
         self.assertEqual(nodes, ['router1', 'router2'])
+        self.assertEqual(cached_nodes, nodes)
+        reopen.assert_not_called()
     
     def test_validate_lab_files_valid(self):
         """Test validation of lab files - all present"""
-        with patch('pathlib.Path.exists', return_value=True):
-            is_valid, missing = self.clab_runner.validate_lab_files(Path('/tmp/test-repo'))
-        
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_path = Path(tmp)
+            (repo_path / 'lab-metadata.yaml').touch()
+            clab_dir = repo_path / 'clab_tools_files'
+            clab_dir.mkdir()
+            for name in ('config.yaml', 'nodes.csv', 'connections.csv'):
+                (clab_dir / name).touch()
+
+            is_valid, missing = self.clab_runner.validate_lab_files(repo_path)
+
         self.assertTrue(is_valid)
         self.assertEqual(missing, [])
     
@@ -114,16 +132,17 @@ class TestClabRunner(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn('clab_tools_files/bootstrap.sh', missing)
     
-    @patch('subprocess.run')
-    def test_check_clab_tools_available(self, mock_run):
+    @patch('shutil.which')
+    def test_check_clab_tools_available(self, mock_which):
         """Test checking clab-tools availability"""
-        mock_run.return_value = Mock(returncode=0)
-        
-        self.assertTrue(self.clab_runner.check_clab_tools())
-        
-        mock_run.return_value = Mock(returncode=1)
+        mock_which.return_value = None
         self.assertFalse(self.clab_runner.check_clab_tools())
 
+        # Resolution is a pure PATH lookup, no subprocess involved
+        mock_which.return_value = '/usr/local/bin/clab-tools'
+        self.assertTrue(self.clab_runner.check_clab_tools())
+        self.assertEqual(self.clab_runner._resolved_cmd, '/usr/local/bin/clab-tools')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Unit tests for GitOperations module
 """
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -77,19 +78,37 @@ class TestGitOperations(unittest.TestCase):
         
         self.assertEqual(tags, ['v1.0.0', 'v1.1.0', 'v2.0.0'])
     
+    @patch('subprocess.run')
+    def test_get_repo_info(self, mock_run):
+        """Test the batched repository info query"""
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout='abcdef1234567890\nmain\n', stderr=''),
+            Mock(returncode=0, stdout='v1.0.0\nv1.1.0', stderr=''),
+            Mock(returncode=0, stdout='git@github.com:test/repo.git\n', stderr=''),
+        ]
+
+        with patch.object(self.git_ops, 'is_git_repo', return_value=True):
+            info = self.git_ops.get_repo_info(Path('/tmp/test'))
+
+        self.assertEqual(info['commit'], 'abcdef12')
+        self.assertEqual(info['branch'], 'main')
+        self.assertEqual(info['tags'], ['v1.0.0', 'v1.1.0'])
+        self.assertEqual(info['remote_url'], 'git@github.com:test/repo.git')
+
     def test_is_git_repo(self):
         """Test git repository detection"""
-        with patch('pathlib.Path.exists') as mock_exists:
-            with patch('pathlib.Path.is_dir') as mock_is_dir:
-                # Test valid git repo
-                mock_exists.side_effect = [True, True]  # repo exists, .git exists
-                mock_is_dir.return_value = True
-                
-                self.assertTrue(self.git_ops.is_git_repo(Path('/tmp/test')))
-                
-                # Test non-git directory
-                mock_exists.side_effect = [True, False]  # repo exists, .git doesn't
-                self.assertFalse(self.git_ops.is_git_repo(Path('/tmp/test')))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo = Path(tmp_dir) / 'repo'
+            (repo / '.git').mkdir(parents=True)
+            self.assertTrue(self.git_ops.is_git_repo(repo))
+
+            plain = Path(tmp_dir) / 'plain'
+            plain.mkdir()
+            self.assertFalse(self.git_ops.is_git_repo(plain))
+
+            # Negatives are not cached, so a fresh clone flips the answer
+            (plain / '.git').mkdir()
+            self.assertTrue(self.git_ops.is_git_repo(plain))
 
 
 if __name__ == '__main__':
@@ -25,17 +25,20 @@ class TestLabManagerState:
         
         assert state == {'repos': {}, 'deployments': {}}
     
-    @patch('builtins.open', new_callable=Mock)
-    @patch('pathlib.Path.mkdir')
-    def test_save_state(self, mock_mkdir, mock_open, lab_manager):
+    def test_save_state(self, lab_manager):
         """Test saving state to file"""
         lab_manager.state = {'repos': {'test': {}}, 'deployments': {}}
+
+        # _save_state only marks the state dirty; the writer thread (or
+        # an explicit flush) performs the actual write
         lab_manager._save_state()
-        
-        mock_open.assert_called_once()
-        handle = mock_open.return_value.__enter__.return_value
-        written_data = ''.join(str(call) for call in handle.write.call_args_list)
-        assert '"repos"' in written_data or handle.write.call_count > 0
+        assert lab_manager._state_dirty.is_set()
+
+        lab_manager._flush_state()
+
+        state_file = Path(lab_manager.config['state_file'])
+        assert json.loads(state_file.read_text()) == lab_manager.state
+        assert not lab_manager._state_dirty.is_set()
 
 @pytest.mark.unit 
 class TestLabManagerRepositories:
@@ -124,12 +127,12 @@ class TestLabManagerDeployments:
             }
         }
         
-        with patch('threading.Thread') as mock_thread:
+        with patch('src.backend.core.lab_manager.asyncio.run_coroutine_threadsafe') as mock_schedule:
             task_id = lab_manager.deploy_lab_async('test-lab')
-        
+
         assert task_id is not None
-        mock_thread.assert_called_once()
-        mock_thread.return_value.start.assert_called_once()
+        mock_schedule.assert_called_once()
+        assert lab_manager.active_tasks[task_id]['status'] == 'queued'
     
     def test_destroy_lab_success(self, lab_manager, mock_clab_runner):
         """Test successful lab destruction"""
@@ -178,41 +181,45 @@ class TestLabManagerDeployments:
 class TestLabManagerConfiguration:
     """Test LabManager configuration scenario functionality"""
     
+    @patch('src.backend.core.lab_manager.os.scandir')
     @patch('src.backend.core.lab_manager.Path')
-    def test_list_config_scenarios(self, mock_path_class, lab_manager):
+    def test_list_config_scenarios(self, mock_path_class, mock_scandir, lab_manager):
         """Test listing configuration scenarios"""
         lab_manager.state['repos'] = {
             'test-lab': {
                 'path': '/tmp/test-lab'
             }
         }
-        
+
         # Mock the configs directory
         mock_configs_dir = Mock()
         mock_configs_dir.exists.return_value = True
-        
-        # Create mock file/dir objects
+
+        # Create mock DirEntry objects
         mock_baseline = Mock()
         mock_baseline.is_dir.return_value = True
         mock_baseline.name = 'baseline'
-        
+
         mock_scenario = Mock()
         mock_scenario.is_dir.return_value = True
         mock_scenario.name = 'scenario-1'
-        
+
         mock_readme = Mock()
         mock_readme.is_dir.return_value = False
         mock_readme.name = 'README.md'
-        
-        mock_configs_dir.iterdir.return_value = [mock_baseline, mock_scenario, mock_readme]
-        
+
+        mock_scandir.return_value.__enter__ = Mock(
+            return_value=iter([mock_baseline, mock_scenario, mock_readme])
+        )
+        mock_scandir.return_value.__exit__ = Mock(return_value=False)
+
         # Mock repo path
         mock_repo_path = Mock()
         mock_repo_path.__truediv__ = Mock(return_value=mock_configs_dir)
-        
+
         # Configure Path constructor to return our mock
         mock_path_class.return_value = mock_repo_path
-        
+
         scenarios = lab_manager.list_config_scenarios('test-lab')
-        
+
         assert scenarios == ['baseline', 'scenario-1']
\ No newline at end of file
@@ -206,19 +206,25 @@ class TestNetBoxManager:
         mock_pynetbox.dcim.device_types.get.return_value = mock_device_type
         mock_pynetbox.dcim.manufacturers.get.return_value = mock_manufacturer
         
-        # Mock device creation
-        mock_pynetbox.dcim.devices.create.return_value = Mock(name='test-lab-r1')
-        mock_pynetbox.dcim.devices.get.return_value = None  # No existing device
-        
+        # Mock batched device creation (one create call, list payload)
+        created_r1 = Mock()
+        created_r1.name = 'test-lab-r1'
+        created_r2 = Mock()
+        created_r2.name = 'test-lab-r2'
+        mock_pynetbox.dcim.devices.create.return_value = [created_r1, created_r2]
+        mock_pynetbox.dcim.devices.filter.return_value = []  # No existing devices
+
         # Test registration
         nodes = [
             {'hostname': 'r1', 'mgmt_ip': '10.100.100.1'},
             {'hostname': 'r2', 'mgmt_ip': '10.100.100.2'}
         ]
         result = netbox_manager.register_devices('test-lab', 'Test Lab', nodes)
-        
-        assert len(result) == 2
-        assert mock_pynetbox.dcim.devices.create.call_count == 2
+
+        assert result == ['test-lab-r1', 'test-lab-r2']
+        mock_pynetbox.dcim.devices.create.assert_called_once()
+        batch = mock_pynetbox.dcim.devices.create.call_args[0][0]
+        assert [d['name'] for d in batch] == ['test-lab-r1', 'test-lab-r2']
     
     def test_unregister_devices(self, netbox_manager, mock_pynetbox):
         """Test device unregistration"""